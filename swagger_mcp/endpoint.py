@@ -1,5 +1,45 @@
+import re
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set
+from functools import cached_property
+from typing import Dict, List, Optional, Any, Set, Tuple
+
+# Matches a "{name}" placeholder in a URL path template
+_PATH_PARAM_PATTERN = re.compile(r'\{([^{}]+)\}')
+
+
+def split_path_template(path: str) -> Tuple[str, ...]:
+    """
+    Split a URL path template into literal text and parameter names.
+    
+    Args:
+        path: The path template, e.g. "/pets/{petId}/toys"
+        
+    Returns:
+        A tuple alternating between literal text (even indices) and parameter
+        names (odd indices), e.g. ("/pets/", "petId", "/toys")
+    """
+    if not path.startswith('/'):
+        path = '/' + path
+    return tuple(_PATH_PARAM_PATTERN.split(path))
+
+
+def render_path_template(parts: Tuple[str, ...], path_params: Dict[str, Any]) -> str:
+    """
+    Substitute path parameter values into a template split by split_path_template.
+    
+    Args:
+        parts: The split path template
+        path_params: Dictionary of path parameter values
+        
+    Returns:
+        The path with parameters substituted; placeholders without a value are left as is
+    """
+    return "".join(
+        part if i % 2 == 0
+        else str(path_params[part]) if part in path_params
+        else "{" + part + "}"
+        for i, part in enumerate(parts)
+    )
 
 
 @dataclass
@@ -63,6 +103,16 @@ class Endpoint:
             return self.servers[0]['url']
         return None
     
+    @cached_property
+    def path_template_parts(self) -> Tuple[str, ...]:
+        """
+        The endpoint path split into literal text and parameter names, computed once.
+        
+        Returns:
+            The split path template (see split_path_template)
+        """
+        return split_path_template(self.path)
+    
     def get_full_url(self, server_url: Optional[str] = None, path_params: Optional[Dict[str, Any]] = None) -> str:
         """
         Construct the full URL for this endpoint with path parameters substituted.
@@ -80,16 +130,8 @@ class Endpoint:
         if base_url and base_url.endswith('/'):
             base_url = base_url[:-1]
             
-        # Ensure path starts with slash
-        endpoint_path = self.path
-        if not endpoint_path.startswith('/'):
-            endpoint_path = '/' + endpoint_path
-            
-        # Substitute path parameters if provided
-        if path_params:
-            for param_name, param_value in path_params.items():
-                placeholder = '{' + param_name + '}'
-                endpoint_path = endpoint_path.replace(placeholder, str(param_value))
+        # Substitute path parameters into the precompiled path template
+        endpoint_path = render_path_template(self.path_template_parts, path_params or {})
         
         return f"{base_url}{endpoint_path}"
     
@@ -102,6 +144,25 @@ class Endpoint:
         """
         return self.request_body_required and self.request_body_schema is not None
     
+    @cached_property
+    def required_parameters_by_type(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        The required parameter names grouped by parameter type, computed once from the parameter schemas.
+        
+        Returns:
+            Dictionary with keys 'path', 'query', 'header', 'form' and values as tuples of parameter names in schema order
+        """
+        schemas = {
+            'path': self.path_parameters_schema,
+            'query': self.query_parameters_schema,
+            'header': self.header_parameters_schema,
+            'form': self.form_parameters_schema
+        }
+        return {
+            param_type: tuple((schema or {}).get('required', ()))
+            for param_type, schema in schemas.items()
+        }
+    
     def get_required_parameters(self) -> Dict[str, Set[str]]:
         """
         Get a dictionary of all required parameters grouped by parameter type.
@@ -109,30 +170,7 @@ class Endpoint:
         Returns:
             Dictionary with keys 'path', 'query', 'header', 'form' and values as sets of parameter names
         """
-        required_params = {
-            'path': set(),
-            'query': set(),
-            'header': set(),
-            'form': set()
-        }
-        
-        # Path parameters - these are usually all required in OpenAPI
-        if self.path_parameters_schema and 'required' in self.path_parameters_schema:
-            required_params['path'] = set(self.path_parameters_schema['required'])
-            
-        # Query parameters
-        if self.query_parameters_schema and 'required' in self.query_parameters_schema:
-            required_params['query'] = set(self.query_parameters_schema['required'])
-            
-        # Header parameters
-        if self.header_parameters_schema and 'required' in self.header_parameters_schema:
-            required_params['header'] = set(self.header_parameters_schema['required'])
-            
-        # Form parameters
-        if self.form_parameters_schema and 'required' in self.form_parameters_schema:
-            required_params['form'] = set(self.form_parameters_schema['required'])
-            
-        return required_params
+        return {param_type: set(names) for param_type, names in self.required_parameters_by_type.items()}
     
     def get_successful_response_schema(self) -> Optional[Dict[str, Any]]:
         """
@@ -1,14 +1,30 @@
-from logging.handlers import RotatingFileHandler
-import requests, json
-import logging
-from typing import Dict, List, Any, Optional, Union
+import json
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Union
 from swagger_mcp.endpoint import Endpoint
 from swagger_mcp.simple_endpoint import SimpleEndpoint, create_simple_endpoint
 from swagger_mcp.logging import setup_logger
 
+if TYPE_CHECKING:
+    import requests
+
 logger = setup_logger(__name__)
 
 
+def _get_requests():
+    """Import requests on first use and bind it as this module's requests attribute."""
+    global requests
+    if "requests" not in globals():
+        import requests
+    return requests
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve requests before the first call too, so patch('swagger_mcp.endpoint_invoker.requests.request') works."""
+    if name == "requests":
+        return _get_requests()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class EndpointInvocationError(Exception):
     """Base exception for errors that occur during endpoint invocation."""
     pass
@@ -112,7 +128,7 @@ class EndpointInvoker:
                           server_url: Optional[str] = None,
                           headers: Optional[Dict[str, str]] = None,
                           bearer_token: Optional[str] = None,
-                          timeout: Optional[float] = None) -> requests.Response:
+                          timeout: Optional[float] = None) -> "requests.Response":
         """
         Invoke the endpoint with a single parameter object that contains path parameters,
         query parameters, and request body properties combined.
@@ -135,16 +151,19 @@ class EndpointInvoker:
         
         # Validate required parameters
         if params:
-            required_params = simple_endpoint.get_required_parameters()
-            for param_name in required_params:
+            for param_name in simple_endpoint.required_parameters:
                 if param_name not in params:
                     raise MissingRequiredParameterError(param_name)
         
         # Extract path, query, form, and body parameters
-        path_params = simple_endpoint.get_path_parameters(params) if params else {}
-        query_params = simple_endpoint.get_query_parameters(params) if params else {}
-        form_params = simple_endpoint.get_form_parameters(params) if params else {}
-        request_body = simple_endpoint.get_request_body(params) if params else None
+        if params:
+            grouped_params = simple_endpoint.group_parameters(params)
+            path_params = grouped_params['path']
+            query_params = grouped_params['query']
+            form_params = grouped_params['form']
+            request_body = grouped_params['body']
+        else:
+            path_params, query_params, form_params, request_body = {}, {}, {}, None
         
         # If we have a request body but it's empty, set it to None unless it's required
         if request_body and not request_body:
@@ -172,7 +191,7 @@ class EndpointInvoker:
                headers: Optional[Dict[str, str]] = None,
                request_body: Optional[Any] = None,
                bearer_token: Optional[str] = None,
-               timeout: Optional[float] = None) -> requests.Response:
+               timeout: Optional[float] = None) -> "requests.Response":
         """
         Invoke the endpoint with the provided parameters.
         
@@ -217,7 +236,7 @@ class EndpointInvoker:
                         request_body: Optional[Any] = None,
                         bearer_token: Optional[str] = None,
                         timeout: Optional[float] = None,
-                        simple_endpoint: Optional[SimpleEndpoint] = None) -> requests.Response:
+                        simple_endpoint: Optional[SimpleEndpoint] = None) -> "requests.Response":
         """
         Internal method to invoke the endpoint with the provided parameters.
         
@@ -321,7 +340,7 @@ Request details:
         logger.info(log_message)
 
         # Make the request
-        return requests.request(
+        return _get_requests().request(
             method=method,
             url=url,
             params=query_params,
@@ -359,8 +378,7 @@ Request details:
             url = endpoint_to_use.get_full_url(server_url, path_params)
         else:
             # For regular Endpoint, validate required parameters
-            required_params = endpoint_to_use.get_required_parameters()
-            for param_name in required_params.get('path', set()):
+            for param_name in endpoint_to_use.required_parameters_by_type['path']:
                 if param_name not in path_params:
                     raise MissingPathParameterError(param_name)
             
@@ -415,11 +433,13 @@ Request details:
             pass
         else:
             # Regular Endpoint has separate header parameter tracking
-            required_params = endpoint_to_use.get_required_parameters()
-            for param_name in required_params.get('header', set()):
+            required_headers = endpoint_to_use.required_parameters_by_type['header']
+            if required_headers:
                 # Convert to lowercase for case-insensitive header comparison
-                if param_name.lower() not in [k.lower() for k in prepared_headers]:
-                    raise MissingHeaderParameterError(param_name)
+                provided_headers = {k.lower() for k in prepared_headers}
+                for param_name in required_headers:
+                    if param_name.lower() not in provided_headers:
+                        raise MissingHeaderParameterError(param_name)
         
         # Add content type if sending a request body and content type is not already set
         request_content_types = endpoint_to_use.request_content_types
@@ -453,22 +473,9 @@ Request details:
         if not query_params:
             query_params = {}
             
-        # Get required query parameters from the endpoint
-        required_params = set()
-        if hasattr(endpoint_to_use, 'get_required_parameters'):
-            required_params_result = endpoint_to_use.get_required_parameters()
-            if isinstance(required_params_result, dict):
-                # Handle Endpoint case where result is Dict[str, Set[str]]
-                required_params = required_params_result.get('query', set())
-            else:
-                # Handle SimpleEndpoint case where result is Set[str]
-                # Only include parameters that are marked as query parameters in the mapping
-                required_params = {param for param in required_params_result 
-                                if hasattr(endpoint_to_use, 'parameter_type_mapping') and 
-                                endpoint_to_use.parameter_type_mapping.get(param) == 'query'}
-        
-        # Check that all required parameters are present
-        for param_name in required_params:
+        # Check that all required query parameters are present (both endpoint types
+        # group their required parameters by type when first asked)
+        for param_name in endpoint_to_use.required_parameters_by_type.get('query', ()):
             if param_name not in query_params:
                 raise MissingQueryParameterError(param_name)
         
@@ -512,11 +519,9 @@ Request details:
             return form_params
         
         # For regular Endpoint, check required form parameters
-        if hasattr(endpoint_to_use, 'form_parameters_schema') and endpoint_to_use.form_parameters_schema:
-            if 'required' in endpoint_to_use.form_parameters_schema:
-                for param_name in endpoint_to_use.form_parameters_schema['required']:
-                    if param_name not in form_params:
-                        raise MissingFormParameterError(param_name)
+        for param_name in endpoint_to_use.required_parameters_by_type['form']:
+            if param_name not in form_params:
+                raise MissingFormParameterError(param_name)
         
         return form_params
     
@@ -1,22 +1,14 @@
 import json
-import requests
-import os
-import yaml
-import logging
-import argparse
 import asyncio
 import re
 import traceback
-from logging.handlers import RotatingFileHandler
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Callable, Awaitable, Iterator
+from typing import Dict, List, Optional, Any, Union
 
 from mcp.server import Server, NotificationOptions
-from mcp.types import Tool, CallToolResult, TextContent, ImageContent, EmbeddedResource
+from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
 from mcp.server.stdio import stdio_server
 from mcp.server.models import InitializationOptions
 from swagger_mcp.openapi_parser import OpenAPIParser
-from swagger_mcp.endpoint import Endpoint
 from swagger_mcp.simple_endpoint import SimpleEndpoint, create_simple_endpoint
 from swagger_mcp.endpoint_invoker import EndpointInvoker
 from swagger_mcp.logging import setup_logger
@@ -67,6 +59,9 @@ class OpenAPIMCPServer:
         self.additional_headers = additional_headers or {}
         self.include_pattern = include_pattern
         self.exclude_pattern = exclude_pattern
+        # Compile the path filters once; they are checked for every endpoint on every list_tools call
+        self._include_re = re.compile(include_pattern) if include_pattern else None
+        self._exclude_re = re.compile(exclude_pattern) if exclude_pattern else None
         self.cursor_mode = cursor_mode
         self.const_values = const_values or {}
         
@@ -90,71 +85,97 @@ class OpenAPIMCPServer:
             simple_endpoint = create_simple_endpoint(endpoint)
             self.simple_endpoints[simple_endpoint.operation_id] = simple_endpoint
             
-        # Register the list_tools and call_tool handlers
-        self._register_handlers()
+        # Register the list_tools and call_tool handlers (kept so tests can call them directly)
+        self._handlers = self._register_handlers()
     
+    def _should_expose(self, endpoint: SimpleEndpoint) -> bool:
+        """
+        Decide whether an endpoint should be exposed as a tool.
+        
+        Args:
+            endpoint: The SimpleEndpoint to check
+            
+        Returns:
+            False for deprecated endpoints and paths filtered out by the include/exclude patterns
+        """
+        # Skip deprecated endpoints
+        if endpoint.deprecated:
+            return False
+        
+        # Check exclude pattern first - if path matches exclude pattern, skip this endpoint
+        if self._exclude_re and self._exclude_re.search(endpoint.path):
+            logger.info(f"Excluding endpoint {endpoint.path} due to exclude pattern")
+            return False
+        
+        # If include pattern is specified and path doesn't match, skip this endpoint
+        if self._include_re and not self._include_re.search(endpoint.path):
+            logger.info(f"Excluding endpoint {endpoint.path} due to include pattern")
+            return False
+        
+        return True
+    
+    def _build_tool(self, operation_id: str, endpoint: SimpleEndpoint) -> Tool:
+        """
+        Build the MCP tool for a single endpoint.
+        
+        Args:
+            operation_id: The operation ID used as the tool name
+            endpoint: The SimpleEndpoint the tool invokes
+            
+        Returns:
+            The Tool definition
+        """
+        # Create input schema from the endpoint's combined parameter schema,
+        # leaving out const parameters
+        combined_schema = endpoint.combined_parameter_schema or {}
+        properties = {
+            name: schema for name, schema in combined_schema.get('properties', {}).items()
+            if name not in self.const_values
+        }
+        
+        # In cursor mode, remove parameter descriptions (without mutating the endpoint's schema)
+        if self.cursor_mode:
+            properties = {
+                name: {k: v for k, v in schema.items() if k != "description"} if isinstance(schema, dict) else schema
+                for name, schema in properties.items()
+            }
+        
+        input_schema = {
+            "type": "object",
+            "properties": properties,
+            "required": [r for r in combined_schema.get('required', []) if r not in self.const_values]
+        }
+        
+        logger.info(f"Added tool: {operation_id} ({endpoint.method.upper()} {endpoint.path})")
+        return Tool(
+            name=operation_id,
+            description=endpoint.tool_description,
+            inputSchema=input_schema
+        )
+    
+    def _build_tools(self) -> List[Tool]:
+        """
+        Build the list of MCP tools from the OpenAPI spec endpoints.
+        
+        Returns:
+            List of Tool objects, one per non-deprecated, non-filtered endpoint
+        """
+        logger.info("Listing available tools")
+        tools = [
+            self._build_tool(operation_id, endpoint)
+            for operation_id, endpoint in self.simple_endpoints.items()
+            if self._should_expose(endpoint)
+        ]
+        logger.info(f"Total tools available: {len(tools)}")
+        return tools
+
     def _register_handlers(self):
         """Register the MCP handlers for listing tools and handling tool calls."""
         
         @self.server.list_tools()
         async def list_tools() -> List[Tool]:
             """Return a list of tools based on the OpenAPI spec endpoints."""
-            logger.info("Listing available tools")
-            tools = []
-            
-            for operation_id, endpoint in self.simple_endpoints.items():
-                # Skip deprecated endpoints
-                if endpoint.deprecated:
-                    continue
-                
-                # Apply include and exclude patterns if specified
-                if self.include_pattern or self.exclude_pattern:
-                    
-                    # Check exclude pattern first - if path matches exclude pattern, skip this endpoint
-                    if self.exclude_pattern and re.search(self.exclude_pattern, endpoint.path):
-                        logger.info(f"Excluding endpoint {endpoint.path} due to exclude pattern")
-                        continue
-                    
-                    # If include pattern is specified and path doesn't match, skip this endpoint
-                    if self.include_pattern and not re.search(self.include_pattern, endpoint.path):
-                        logger.info(f"Excluding endpoint {endpoint.path} due to include pattern")
-                        continue
-                
-                # Create input schema from the endpoint's combined parameter schema
-                input_schema = {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-                
-                if endpoint.combined_parameter_schema and 'properties' in endpoint.combined_parameter_schema:
-                    input_schema["properties"] = endpoint.combined_parameter_schema['properties'].copy()
-                    
-                    # Remove const parameters from the input schema
-                    for param_name in self.const_values:
-                        if param_name in input_schema["properties"]:
-                            del input_schema["properties"][param_name]
-                            
-                    # In cursor mode, remove parameter descriptions
-                    if self.cursor_mode and isinstance(input_schema["properties"], dict):
-                        for param in input_schema["properties"].values():
-                            if isinstance(param, dict) and "description" in param:
-                                del param["description"]
-                    
-                    if 'required' in endpoint.combined_parameter_schema:
-                        input_schema["required"] = [r for r in endpoint.combined_parameter_schema['required'] if r not in self.const_values]
-                
-                # Create the tool definition
-                tool = Tool(
-                    name=operation_id,
-                    description=endpoint.summary or f"{endpoint.method.upper()} {endpoint.path}",
-                    inputSchema=input_schema
-                )
-                tools.append(tool)
-                logger.info(f"Added tool: {operation_id} ({endpoint.method.upper()} {endpoint.path})")
-            
-            logger.info(f"Total tools available: {len(tools)}")
-            return tools
+            return self._build_tools()
         
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Dict[str, Any]) -> List[Union[TextContent, ImageContent, EmbeddedResource]]:
@@ -188,11 +209,15 @@ class OpenAPIMCPServer:
                 
                 # Merge const values with provided arguments
                 merged_arguments = {**arguments}
+                properties = endpoint.combined_parameter_schema.get('properties', {})
                 for param_name, value in self.const_values.items():
-                    if param_name in endpoint.combined_parameter_schema.get('properties', {}):
+                    if param_name in properties:
                         merged_arguments[param_name] = value
                 
-                response = invoker.invoke_with_params(
+                # Run the blocking HTTP request in a worker thread so that concurrent
+                # tool calls do not stall the event loop
+                response = await asyncio.to_thread(
+                    invoker.invoke_with_params,
                     params=merged_arguments,
                     server_url=self.server_url,
                     bearer_token=self.bearer_token,
@@ -204,9 +229,9 @@ class OpenAPIMCPServer:
                 # Process the response
                 try:
                     result = response.json()
-                    logger.info(f"Received JSON response of size: {len(json.dumps(result))} bytes")
-                    # Format the result as a pretty JSON string
+                    # Format the result as a pretty JSON string (serialized once, also used for the size log)
                     formatted_result = json.dumps(result, indent=2, default=str)
+                    logger.info(f"Received JSON response of size: {len(formatted_result)} bytes")
                     return [TextContent(type="text", text=formatted_result)]
                 except ValueError:
                     # Not JSON content
@@ -1,14 +1,46 @@
 import os
 import json
-import requests
+import operator
 import yaml
 
+from functools import cached_property
 from typing import Dict, List, Any, Optional, Union, Set
 from swagger_mcp.endpoint import Endpoint
 from swagger_mcp.logging import setup_logger
 
 logger = setup_logger(__name__)
 
+# Path item keys that are operations (the rest are shared fields such as parameters)
+_HTTP_METHODS = frozenset(('get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace'))
+
+# Parse YAML specs with libyaml's C loader when PyYAML was built with it (much faster on large specs)
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+def build_v2_servers(host: str, base_path: Optional[str] = None, schemes: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Build the server list for a Swagger 2.0 spec from its host, basePath and schemes.
+    
+    Args:
+        host: The spec's ``host`` (servers can't be built without one)
+        base_path: The spec's ``basePath``, if any
+        schemes: The spec's ``schemes``; defaults to ``["http"]`` per spec
+        
+    Returns:
+        One server entry per scheme, or an empty list if there is no host
+    """
+    if not host:
+        return []
+    
+    base_path = base_path or ''
+    # Ensure base_path starts with a single '/'
+    if base_path and not base_path.startswith('/'):
+        base_path = '/' + base_path
+    # Remove trailing slash except root
+    if base_path == '/':
+        base_path = ''  # root path, keep clean
+    
+    return [{"url": f"{scheme}://{host}{base_path}"} for scheme in schemes or ["http"]]
+
 class CircularReferenceError(ValueError):
     """Raised when a circular reference is detected in schema resolution."""
     
@@ -45,6 +77,9 @@ class OpenAPIParser:
         self.has_bearer_schemes = self._has_bearer_schemes()
         self.servers = self._extract_servers_from_spec()
         self.endpoints = self._parse_endpoints()
+        # Filled in by _endpoint_views() on first use
+        self._endpoint_views_source: Optional[tuple] = None
+        self._endpoint_views_cache: Dict[str, Any] = {}
 
     def _extract_servers_from_spec(self) -> List[Dict[str, Any]]:
         """Return a list of servers that apply to the entire spec.
@@ -59,21 +94,8 @@ class OpenAPIParser:
 
         # Handle Swagger/OpenAPI v2
         if self.spec.get('swagger') == '2.0':
-            host = self.spec.get('host', '')
-            base_path = self.spec.get('basePath', '') or ''
-            if host:
-                # Ensure base_path starts with a single '/'
-                if base_path and not base_path.startswith('/'):
-                    base_path = '/' + base_path
-                schemes = self.spec.get('schemes', ["http"])
-                servers: List[Dict[str, Any]] = []
-                for scheme in schemes or ["http"]:
-                    url = f"{scheme}://{host}{base_path}"
-                    # Remove trailing slash except root
-                    if base_path == '/':
-                        url = f"{scheme}://{host}"  # root path, keep clean
-                    servers.append({"url": url})
-                return servers
+            return build_v2_servers(self.spec.get('host', ''), self.spec.get('basePath'), self.spec.get('schemes'))
+
         # Fallback: empty list
         return []
 
@@ -84,7 +106,7 @@ class OpenAPIParser:
         Returns:
             True if at least one bearer token scheme is defined, False otherwise
         """
-        return any(self._is_bearer_scheme(scheme_name) for scheme_name in self.security_schemes)
+        return bool(self._bearer_scheme_names)
 
     def _load_spec(self, spec: Union[str, dict]) -> dict:
         """
@@ -105,6 +127,7 @@ class OpenAPIParser:
             # Check if it's a URL
             if spec.startswith(('http://', 'https://')):
                 logger.info(f"Fetching OpenAPI spec from URL: {spec}")
+                import requests
                 response = requests.get(spec)
                 response.raise_for_status()  # Raise exception for non-200 status codes
                 
@@ -114,7 +137,7 @@ class OpenAPIParser:
                     return response.json()
                 else:
                     # Assume YAML or try to parse as such
-                    return yaml.safe_load(response.text)
+                    return yaml.load(response.text, Loader=_YAML_LOADER)
                     
             # Check if it's a file path
             if os.path.isfile(spec):
@@ -124,7 +147,7 @@ class OpenAPIParser:
                         if spec.lower().endswith('.json'):
                             return json.loads(content)
                         else:
-                            return yaml.safe_load(content)
+                            return yaml.load(content, Loader=_YAML_LOADER)
                     except Exception as e:
                         raise ValueError(f"Failed to parse spec file {spec}: {str(e)}")
                         
@@ -134,7 +157,7 @@ class OpenAPIParser:
             except json.JSONDecodeError:
                 # Try parsing as YAML string
                 try:
-                    return yaml.safe_load(spec)
+                    return yaml.load(spec, Loader=_YAML_LOADER)
                 except yaml.YAMLError as e:
                     raise ValueError(f"Failed to parse spec as JSON or YAML string: {str(e)}")
                     
@@ -266,7 +289,7 @@ class OpenAPIParser:
         # Inside each object, keys are security scheme names and values are scopes (AND relationship).
         for requirement in security_requirements:
             # Check if any of the schemes in this requirement is a bearer scheme
-            if any(self._is_bearer_scheme(scheme_name) for scheme_name in requirement):
+            if not self._bearer_scheme_names.isdisjoint(requirement):
                 return True
         
         return False
@@ -321,7 +344,7 @@ class OpenAPIParser:
             return False
             
         for requirement in security_requirements:
-            if any(self._is_oauth_scheme(scheme_name) for scheme_name in requirement):
+            if not self._oauth_scheme_names.isdisjoint(requirement):
                 return True
                 
         return False
@@ -345,14 +368,30 @@ class OpenAPIParser:
         # everything else (apiKey header/query, http basic/bearer) is static
         return False
 
+    # Each declared scheme is classified once; the _requires_* checks then run
+    # for every endpoint as set lookups
+    @cached_property
+    def _bearer_scheme_names(self) -> frozenset:
+        """Names of the declared security schemes that are bearer token schemes."""
+        return frozenset(name for name in self.security_schemes if self._is_bearer_scheme(name))
+
+    @cached_property
+    def _oauth_scheme_names(self) -> frozenset:
+        """Names of the declared security schemes that are OAuth schemes."""
+        return frozenset(name for name in self.security_schemes if self._is_oauth_scheme(name))
+
+    @cached_property
+    def _dynamic_scheme_names(self) -> frozenset:
+        """Names of the declared security schemes that require runtime negotiation."""
+        return frozenset(name for name in self.security_schemes if self._is_dynamic_scheme(name))
+
     def _requires_dynamic_only(self, security_requirements: List[Dict[str, Any]]) -> bool:
         """Return True if each alternative requirement is composed solely of dynamic schemes."""
         if not security_requirements:
             return False
         for requirement in security_requirements:
-            for scheme_name in requirement:
-                if not self._is_dynamic_scheme(scheme_name):
-                    return False
+            if not self._dynamic_scheme_names.issuperset(requirement):
+                return False
         return True
 
     # Legacy cookie-only check kept for backward compatibility
@@ -476,6 +515,12 @@ class OpenAPIParser:
         # Get the global security requirements
         self.global_security = self.spec.get('security', [])
         
+        # Work out what the global security requires once; every endpoint without its own
+        # security requirements shares the same answers
+        global_requires_bearer_auth = self._requires_bearer_auth(self.global_security)
+        global_requires_oauth = self._requires_oauth(self.global_security)
+        global_oauth_scopes = self._get_oauth_scopes(self.global_security) if global_requires_oauth else []
+        
         # self.servers already determined in __init__, no need to reset
         
         # Process each path
@@ -489,7 +534,7 @@ class OpenAPIParser:
             
             # Process each HTTP method
             for method, operation in path_item.items():
-                if method not in ['get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace']:
+                if method not in _HTTP_METHODS:
                     continue
                 
                 try:
@@ -516,10 +561,10 @@ class OpenAPIParser:
                     elif self.global_security:
                         # Fall back to global security if no operation-level security is defined
                         endpoint.security_requirements = self.global_security
-                        endpoint.requires_bearer_auth = self._requires_bearer_auth(self.global_security)
-                        endpoint.requires_oauth = self._requires_oauth(self.global_security)
+                        endpoint.requires_bearer_auth = global_requires_bearer_auth
+                        endpoint.requires_oauth = global_requires_oauth
                         if endpoint.requires_oauth:
-                            endpoint.oauth_scopes = self._get_oauth_scopes(self.global_security)
+                            endpoint.oauth_scopes = list(global_oauth_scopes)
                     
                     # Skip endpoints that require only dynamic authentication (non-static)
                     if self._requires_dynamic_only(endpoint.security_requirements):
@@ -678,6 +723,41 @@ class OpenAPIParser:
         
         return endpoints
 
+    # ------------------------------------------------------------------
+    # Memoized endpoint views
+    # ------------------------------------------------------------------
+    def _endpoint_views(self) -> Dict[str, Any]:
+        """
+        Lists and indexes derived from self.endpoints, rebuilt whenever its endpoints change.
+
+        self.endpoints is a plain dict that callers may replace or modify, so the views are
+        checked against the endpoints they were built from (by identity) before each use.
+        """
+        endpoints = tuple(self.endpoints.values())
+        built_from = self._endpoint_views_source
+        if (built_from is not None and len(built_from) == len(endpoints)
+                and all(map(operator.is_, built_from, endpoints))):
+            return self._endpoint_views_cache
+
+        # Like a linear search, the first endpoint wins when an operationId is reused
+        by_operation_id: Dict[Optional[str], Endpoint] = {}
+        for endpoint in endpoints:
+            by_operation_id.setdefault(endpoint.operation_id, endpoint)
+
+        self._endpoint_views_source = endpoints
+        self._endpoint_views_cache = {
+            'all': list(endpoints),
+            'by_operation_id': by_operation_id,
+            'by_method_path': {(endpoint.method.upper(), endpoint.path): endpoint for endpoint in endpoints},
+            'with_request_body': [endpoint for endpoint in endpoints if endpoint.request_body_schema is not None],
+            'with_query_parameters': [endpoint for endpoint in endpoints if endpoint.query_parameters_schema is not None],
+            'with_path_parameters': [endpoint for endpoint in endpoints if endpoint.path_parameters_schema is not None],
+            'with_form_parameters': [endpoint for endpoint in endpoints if endpoint.form_parameters_schema is not None],
+            'requiring_bearer_auth': [endpoint for endpoint in endpoints if endpoint.requires_bearer_auth],
+            'requiring_oauth': [endpoint for endpoint in endpoints if endpoint.requires_oauth],
+        }
+        return self._endpoint_views_cache
+
     def get_endpoints(self) -> List[Endpoint]:
         """
         Get a list of all parsed endpoints.
@@ -685,7 +765,7 @@ class OpenAPIParser:
         Returns:
             A list of Endpoint objects
         """
-        return list(self.endpoints.values())
+        return list(self._endpoint_views()['all'])
     
     def get_endpoints_with_request_body(self) -> List[Endpoint]:
         """
@@ -694,7 +774,7 @@ class OpenAPIParser:
         Returns:
             A list of Endpoint objects with request bodies
         """
-        return [endpoint for endpoint in self.endpoints.values() if endpoint.request_body_schema is not None]
+        return list(self._endpoint_views()['with_request_body'])
     
     def get_endpoints_with_query_parameters(self) -> List[Endpoint]:
         """
@@ -703,7 +783,7 @@ class OpenAPIParser:
         Returns:
             A list of Endpoint objects with query parameters
         """
-        return [endpoint for endpoint in self.endpoints.values() if endpoint.query_parameters_schema is not None]
+        return list(self._endpoint_views()['with_query_parameters'])
     
     def get_endpoints_with_path_parameters(self) -> List[Endpoint]:
         """
@@ -712,7 +792,7 @@ class OpenAPIParser:
         Returns:
             List of Endpoint objects that have path parameters
         """
-        return [endpoint for endpoint in self.endpoints.values() if endpoint.path_parameters_schema is not None]
+        return list(self._endpoint_views()['with_path_parameters'])
     
     def get_endpoints_with_form_parameters(self) -> List[Endpoint]:
         """
@@ -721,7 +801,7 @@ class OpenAPIParser:
         Returns:
             List of Endpoint objects that have form parameters
         """
-        return [endpoint for endpoint in self.endpoints.values() if endpoint.form_parameters_schema is not None]
+        return list(self._endpoint_views()['with_form_parameters'])
     
     def get_endpoints_requiring_bearer_auth(self) -> List[Endpoint]:
         """
@@ -730,7 +810,7 @@ class OpenAPIParser:
         Returns:
             List of Endpoint objects that require bearer token authentication
         """
-        return [endpoint for endpoint in self.endpoints.values() if endpoint.requires_bearer_auth]
+        return list(self._endpoint_views()['requiring_bearer_auth'])
     
     def get_endpoints_requiring_oauth(self) -> List[Endpoint]:
         """
@@ -739,7 +819,7 @@ class OpenAPIParser:
         Returns:
             List of Endpoint objects that require OAuth authentication
         """
-        return [endpoint for endpoint in self.endpoints.values() if endpoint.requires_oauth]
+        return list(self._endpoint_views()['requiring_oauth'])
     
     def get_endpoint_by_operation_id(self, operation_id: str) -> Optional[Endpoint]:
         """
@@ -749,12 +829,9 @@ class OpenAPIParser:
             operation_id: The operationId to search for
             
         Returns:
-            The Endpoint object or None if not found
+            The first Endpoint object with that operationId, or None if not found
         """
-        for endpoint in self.endpoints.values():
-            if endpoint.operation_id == operation_id:
-                return endpoint
-        return None
+        return self._endpoint_views()['by_operation_id'].get(operation_id)
     
     def get_endpoint(self, method: str, path: str) -> Optional[Endpoint]:
         """
@@ -767,8 +844,7 @@ class OpenAPIParser:
         Returns:
             The Endpoint object or None if not found
         """
-        key = f"{method.upper()}_{path}"
-        return self.endpoints.get(key)
+        return self._endpoint_views()['by_method_path'].get((method.upper(), path))
 
     def get_endpoint_by_method_path(self, method: str, path: str) -> Optional[Endpoint]:
         """
@@ -781,17 +857,15 @@ class OpenAPIParser:
         Returns:
             The Endpoint object or None if not found
         """
-        key = f"{method.upper()}_{path}"
-        return self.endpoints.get(key)
+        return self.get_endpoint(method, path)
 
-    def to_json(self) -> str:
+    def to_list(self) -> List[Dict[str, Any]]:
         """
-        Convert the parsed endpoints to a JSON string.
+        Convert the parsed endpoints to a list of dictionaries.
         
         Returns:
-            JSON string representation of the endpoints
+            One dictionary per endpoint, containing only its non-empty fields
         """
-        # Convert endpoints to a list of dictionaries for JSON serialization
         endpoints_dicts = []
         for endpoint in self.endpoints.values():
             endpoint_dict = {
@@ -846,7 +920,16 @@ class OpenAPIParser:
             
             endpoints_dicts.append(endpoint_dict)
             
-        return json.dumps(endpoints_dicts, indent=2)
+        return endpoints_dicts
+
+    def to_json(self) -> str:
+        """
+        Convert the parsed endpoints to a JSON string.
+        
+        Returns:
+            JSON string representation of the endpoints
+        """
+        return json.dumps(self.to_list(), indent=2)
 
 
 # Example usage
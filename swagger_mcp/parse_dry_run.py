@@ -1,12 +1,6 @@
-from swagger_mcp.endpoint import Endpoint
-from swagger_mcp.openapi_parser import OpenAPIParser
-from swagger_mcp.simple_endpoint import SimpleEndpoint, create_simple_endpoint
 from swagger_mcp.server_arg_parser import parse_args
-import re
 import json
-from typing import Dict
 from swagger_mcp.openapi_mcp_server import OpenAPIMCPServer
-import asyncio
 
 def main():
 
@@ -23,14 +17,7 @@ def main():
     print(f"Cursor Mode: {args.cursor}")
     print(f"Const Values: {const_values}")
 
-    parser = OpenAPIParser(args.spec)
-    endpoints = parser.endpoints
-
-    simple_endpoints: Dict[str, SimpleEndpoint] = {}
-    for endpoint in endpoints:
-        simple_endpoint = create_simple_endpoint(endpoints[endpoint])
-        simple_endpoints[simple_endpoint.operation_id] = simple_endpoint
-
+    # The server parses the spec itself, so it is only loaded (or fetched) once
     server = OpenAPIMCPServer(
         server_name=args.name,
         openapi_spec=args.spec,
@@ -43,15 +30,14 @@ def main():
         const_values=const_values
     )
 
-    handlers = server._register_handlers()
-    list_tools = handlers["list_tools"]
-
-    print("\nAvailable tools:")
-    for tool in asyncio.run(list_tools()):
-        print(f"- {tool.name}")
-        print(f"  Description: {tool.description}")
-        print(f"  Parameters: {json.dumps(tool.inputSchema, indent=2)}")
-        print("\n")
+    # Collect the tool listing and write it in one go rather than one print per line
+    lines = ["\nAvailable tools:"]
+    for tool in server._build_tools():
+        lines.append(f"- {tool.name}")
+        lines.append(f"  Description: {tool.description}")
+        lines.append(f"  Parameters: {json.dumps(tool.inputSchema, indent=2)}")
+        lines.append("\n")
+    print("\n".join(lines))
 
     print(const_values)
 
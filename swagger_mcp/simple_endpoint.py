@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Set
-from swagger_mcp.endpoint import Endpoint
+from functools import cached_property
+from typing import Dict, List, Optional, Any, Set, Tuple
+from swagger_mcp.endpoint import Endpoint, split_path_template, render_path_template
 from swagger_mcp.logging import setup_logger
 
 logger = setup_logger(__name__)
@@ -66,6 +67,16 @@ class SimpleEndpoint:
             return self.servers[0]['url']
         return None
     
+    @cached_property
+    def path_template_parts(self) -> Tuple[str, ...]:
+        """
+        The endpoint path split into literal text and parameter names, computed once.
+        
+        Returns:
+            The split path template (see split_path_template)
+        """
+        return split_path_template(self.path)
+    
     def get_full_url(self, server_url: Optional[str] = None, params: Optional[Dict[str, Any]] = None) -> str:
         """
         Construct the full URL for this endpoint with path parameters substituted.
@@ -83,22 +94,50 @@ class SimpleEndpoint:
         if base_url and base_url.endswith('/'):
             base_url = base_url[:-1]
             
-        # Ensure path starts with slash
-        endpoint_path = self.path
-        if not endpoint_path.startswith('/'):
-            endpoint_path = '/' + endpoint_path
-            
-        # Substitute path parameters if provided
+        # Substitute path parameters into the precompiled path template
+        path_params = {}
         if params:
             path_params = {k: v for k, v in params.items() 
                           if k in self.parameter_type_mapping and self.parameter_type_mapping[k] == 'path'}
-            
-            for param_name, param_value in path_params.items():
-                placeholder = '{' + param_name + '}'
-                endpoint_path = endpoint_path.replace(placeholder, str(param_value))
+        endpoint_path = render_path_template(self.path_template_parts, path_params)
         
         return f"{base_url}{endpoint_path}"
     
+    @property
+    def tool_description(self) -> str:
+        """
+        The description shown for this endpoint's tool.
+        
+        Returns:
+            The endpoint summary, or "METHOD /path" if it has none
+        """
+        return self.summary or f"{self.method.upper()} {self.path}"
+    
+    @cached_property
+    def required_parameters(self) -> Tuple[str, ...]:
+        """
+        The names of all required parameters, computed once from the combined parameter schema.
+        
+        Returns:
+            Tuple of required parameter names in schema order
+        """
+        return tuple(self.combined_parameter_schema.get('required', ()))
+    
+    @cached_property
+    def required_parameters_by_type(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        The required parameter names grouped by parameter type, computed once.
+        
+        Returns:
+            Dictionary mapping parameter types (as in parameter_type_mapping) to tuples of parameter names
+        """
+        grouped: Dict[str, List[str]] = {}
+        for param_name in self.required_parameters:
+            param_type = self.parameter_type_mapping.get(param_name)
+            if param_type:
+                grouped.setdefault(param_type, []).append(param_name)
+        return {param_type: tuple(names) for param_type, names in grouped.items()}
+    
     def get_required_parameters(self) -> Set[str]:
         """
         Get a set of all required parameters.
@@ -106,12 +145,23 @@ class SimpleEndpoint:
         Returns:
             Set of required parameter names
         """
-        required_params = set()
+        return set(self.required_parameters)
+    
+    def group_parameters(self, params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Split the combined parameters by parameter type in a single pass.
         
-        if 'required' in self.combined_parameter_schema:
-            required_params = set(self.combined_parameter_schema['required'])
+        Args:
+            params: Combined parameters dictionary
             
-        return required_params
+        Returns:
+            Dictionary with keys 'path', 'query', 'form' and 'body', each holding the parameters
+            of that type (parameters without a known type are request body parameters)
+        """
+        grouped: Dict[str, Dict[str, Any]] = {'path': {}, 'query': {}, 'form': {}, 'body': {}}
+        for name, value in params.items():
+            grouped[self.parameter_type_mapping.get(name, 'body')][name] = value
+        return grouped
     
     def get_path_parameters(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -1,7 +1,5 @@
 import os
 import pytest
-import time
-import requests
 from pathlib import Path
 from swagger_mcp.openapi_mcp_server import OpenAPIMCPServer
 import sys
@@ -31,17 +29,29 @@ class UvicornTestServer(uvicorn.Server):
                 # Test code here
                 ...
     """
+    def __init__(self, config: uvicorn.Config):
+        super().__init__(config=config)
+        self._ready = threading.Event()
+
     def install_signal_handlers(self):
         # Disable signal handlers in test mode
         pass
 
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        # Signal readiness as soon as the socket is listening
+        if self.started:
+            self._ready.set()
+
     @contextmanager
     def run_in_thread(self):
         thread = threading.Thread(target=self.run)
         thread.start()
         try:
-            while not self.started:
-                time.sleep(0.1)
+            # Wake up on the readiness signal; only stop to check whether startup failed
+            while not self._ready.wait(timeout=0.5):
+                if not thread.is_alive():
+                    raise Exception("Failed to start API server")
             yield
         finally:
             self.should_exit = True
@@ -58,28 +68,13 @@ def sample_api_server(sample_api_port):
     )
     server = UvicornTestServer(config=config)
     
-    # Start server in a thread
+    # Start server in a thread; run_in_thread returns once it is accepting connections
     with server.run_in_thread():
-        # Wait for the server to start
-        max_retries = 30
-        retry_count = 0
-        while retry_count < max_retries:
-            try:
-                response = requests.get(f"http://localhost:{sample_api_port}/docs")
-                if response.status_code == 200:
-                    break
-            except requests.exceptions.ConnectionError:
-                pass
-            time.sleep(0.1)
-            retry_count += 1
-        else:
-            raise Exception("Failed to start API server")
-        
         yield server
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mcp_client(sample_api_url, sample_api_server):
-    """Create an MCP client for testing"""
+    """Create an MCP client for testing (shared, since tests do not modify it)"""
     client = OpenAPIMCPServer(
         server_name="Sample API",
         openapi_spec=f"{sample_api_url}/openapi.json",
@@ -87,6 +82,19 @@ def mcp_client(sample_api_url, sample_api_server):
     )
     return client
 
+@pytest.fixture(scope="session")
+def mcp_handlers(mcp_client):
+    """The MCP handlers registered when the client was built"""
+    return mcp_client._handlers
+
+@pytest.fixture
+def call_tool(mcp_handlers):
+    return mcp_handlers["call_tool"]
+
+@pytest.fixture
+def list_tools(mcp_handlers):
+    return mcp_handlers["list_tools"]
+
 @pytest.fixture(autouse=True)
 def cleanup_database():
     """Clean up the database after each test"""
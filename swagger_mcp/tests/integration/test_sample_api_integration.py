@@ -1,59 +1,113 @@
-from unittest.mock import patch
+from contextlib import ExitStack, contextmanager
+from unittest.mock import create_autospec, patch
 import pytest, json
-from swagger_mcp.openapi_mcp_server import OpenAPIMCPServer
-from sample_rest_api.app.main import app
+from sample_rest_api.app.main import CategoryCreate, app
 
-@pytest.mark.asyncio
-async def test_category_crud_operations(mcp_client: OpenAPIMCPServer):
-    """Test CRUD operations for categories using the MCP client's call_tool method"""
-    handlers = mcp_client._register_handlers()
-    call_tool = handlers["call_tool"]
-    list_tools = handlers["list_tools"]
-    
-    # Setup mock return values
-    mock_category = {
-        "id": "123",
-        "name": "Electronics",
-        "description": "Electronic products",
+# Every test in this module is async; the loop scope comes from pyproject.toml
+pytestmark = pytest.mark.asyncio
+
+# Mock return values for the patched route handlers (only read, never modified)
+MOCK_CATEGORY = {
+    "id": "123",
+    "name": "Electronics",
+    "description": "Electronic products",
+    "created_at": "2025-03-26T14:32:18",
+    "updated_at": "2025-03-26T14:32:18"
+}
+MOCK_UPDATED_CATEGORY = {**MOCK_CATEGORY, "name": "Updated Electronics"}
+
+MOCK_PRODUCTS = [
+    {
+        "category_id": "123",
+        "id": "456",
+        "name": "Gaming Laptop",
+        "description": "High-performance gaming laptop",
+        "price": 1499.99,
         "created_at": "2025-03-26T14:32:18",
         "updated_at": "2025-03-26T14:32:18"
     }
-    mock_updated_category = {**mock_category, "name": "Updated Electronics"}
-    
-    async def mock_create(*args, **kwargs):
-        return mock_category
-    
-    async def mock_read(*args, **kwargs):
-        return mock_category
-    
-    async def mock_update(*args, **kwargs):
-        return mock_updated_category
-    
-    async def mock_delete(*args, **kwargs):
-        return None
+]
+MOCK_SEARCH_RESULT = {
+    "products": MOCK_PRODUCTS,
+    "total_count": len(MOCK_PRODUCTS),
+    "search_metadata": {
+        "page": 1,
+        "items_per_page": 10,
+        "total_pages": 1,
+        "sort_by": "price",
+        "sort_order": "asc",
+        "filters_applied": {
+            "query": None,
+            "min_price": 1000,
+            "max_price": 2000
+        }
+    }
+}
+
+# The sample API's routes, keyed by (method, path)
+ROUTES = {
+    (method, route.path): route
+    for route in app.routes
+    for method in getattr(route, "methods", None) or ()
+}
+
+# Autospecced stand-ins for the route handlers. Building a spec is slow, so
+# each one is created once here and reset whenever a test patches it in.
+ROUTE_MOCKS = {
+    key: create_autospec(route.dependant.call)
+    for key, route in ROUTES.items()
+    if hasattr(route, "dependant")
+}
+
+@contextmanager
+def mock_routes(return_values):
+    """
+    Replace sample API route handlers for the duration of the block.
     
-    # Find the route handlers
-    create_handler = next(route for route in app.routes if route.path == "/categories/" and route.methods == {"POST"})
-    read_handler = next(route for route in app.routes if route.path == "/categories/{category_id}" and route.methods == {"GET"})
-    update_handler = next(route for route in app.routes if route.path == "/categories/{category_id}" and route.methods == {"PUT"})
-    delete_handler = next(route for route in app.routes if route.path == "/categories/{category_id}" and route.methods == {"DELETE"})
+    FastAPI binds each route's request handler to ``route.dependant.call`` when
+    the route is created, so that is what needs patching (``route.endpoint`` is
+    not consulted at request time).
     
-    # Mock the category endpoints
-    with patch.object(create_handler, "endpoint", mock_create), \
-         patch.object(read_handler, "endpoint", mock_read), \
-         patch.object(update_handler, "endpoint", mock_update), \
-         patch.object(delete_handler, "endpoint", mock_delete):
+    Args:
+        return_values: Mapping of (method, path) to the value the route's handler should return
         
+    Yields:
+        Mapping of (method, path) to the autospecced mock handling that route
+    """
+    mocks = {}
+    with ExitStack() as stack:
+        for key, return_value in return_values.items():
+            mock = mocks[key] = ROUTE_MOCKS[key]
+            mock.reset_mock()
+            mock.return_value = return_value
+            stack.enter_context(patch.object(ROUTES[key].dependant, "call", mock))
+        yield mocks
+
+async def test_category_crud_operations(call_tool):
+    """Test CRUD operations for categories using the MCP client's call_tool method"""
+    # Mock the category endpoints
+    with mock_routes({
+        ("POST", "/categories/"): MOCK_CATEGORY,
+        ("GET", "/categories/{category_id}"): MOCK_CATEGORY,
+        ("PUT", "/categories/{category_id}"): MOCK_UPDATED_CATEGORY,
+        ("DELETE", "/categories/{category_id}"): None,
+    }) as mocks:
         # Test create_category
         category = await call_tool("create_category_categories__post", {
             "name": "Electronics",
             "description": "Electronic products"
         })
+        assert json.loads(category[0].text)["id"] == "123"
+        mocks[("POST", "/categories/")].assert_awaited_once_with(
+            category=CategoryCreate(name="Electronics", description="Electronic products")
+        )
         
         # Test read_category
         category = await call_tool("read_category_categories__category_id__get", {
             "category_id": "123"
         })
+        assert json.loads(category[0].text)["name"] == "Electronics"
+        mocks[("GET", "/categories/{category_id}")].assert_awaited_once_with(category_id="123")
         
         # Test update_category
         updated_category = await call_tool("update_category_categories__category_id__put", {
@@ -61,54 +115,22 @@ async def test_category_crud_operations(mcp_client: OpenAPIMCPServer):
             "name": "Updated Electronics",
             "description": "Electronic products"
         })
+        assert json.loads(updated_category[0].text)["name"] == "Updated Electronics"
+        mocks[("PUT", "/categories/{category_id}")].assert_awaited_once_with(
+            category_id="123",
+            category=CategoryCreate(name="Updated Electronics", description="Electronic products")
+        )
         
         # Test delete_category
         await call_tool("delete_category_categories__category_id__delete", {
             "category_id": "123"
         })
+        mocks[("DELETE", "/categories/{category_id}")].assert_awaited_once_with(category_id="123")
 
-@pytest.mark.asyncio
-async def test_product_search_with_mixed_parameters(mcp_client: OpenAPIMCPServer):
+async def test_product_search_with_mixed_parameters(call_tool):
     """Test the product search endpoint with various parameters"""
-    handlers = mcp_client._register_handlers()
-    call_tool = handlers["call_tool"]
-    
-    # Setup mock return value
-    mock_products = [
-        {
-            "category_id": "123",
-            "id": "456",
-            "name": "Gaming Laptop",
-            "description": "High-performance gaming laptop",
-            "price": 1499.99,
-            "created_at": "2025-03-26T14:32:18",
-            "updated_at": "2025-03-26T14:32:18"
-        }
-    ]
-    
-    async def mock_search(*args, **kwargs):
-        return {
-            "products": mock_products,
-            "total_count": len(mock_products),
-            "search_metadata": {
-                "page": 1,
-                "items_per_page": 10,
-                "total_pages": 1,
-                "sort_by": "price",
-                "sort_order": "asc",
-                "filters_applied": {
-                    "query": None,
-                    "min_price": 1000,
-                    "max_price": 2000
-                }
-            }
-        }
-    
-    # Find the search route handler
-    search_handler = next(route for route in app.routes if route.path == "/products/search/{category_id}" and route.methods == {"POST"})
-    
     # Mock the search endpoint
-    with patch.object(search_handler, "endpoint", mock_search):
+    with mock_routes({("POST", "/products/search/{category_id}"): MOCK_SEARCH_RESULT}) as mocks:
         # Test search with mixed parameters
         products = await call_tool("search_products_products_search__category_id__post", {
             "category_id": "123",
@@ -117,18 +139,24 @@ async def test_product_search_with_mixed_parameters(mcp_client: OpenAPIMCPServer
             "sort_by": "price",
             "sort_order": "asc"
         })
+        assert json.loads(products[0].text)["total_count"] == 1
+        mocks[("POST", "/products/search/{category_id}")].assert_awaited_once_with(
+            category_id="123",
+            query=None,
+            min_price=1000,
+            max_price=2000,
+            page=1,
+            items_per_page=10,
+            sort_by="price",
+            sort_order="asc"
+        )
 
-@pytest.mark.asyncio
-async def test_create_category_categories__post_has_required_fields(mcp_client: OpenAPIMCPServer):
+async def test_create_category_categories__post_has_required_fields(list_tools):
     """Test that the create_category endpoint has required fields"""
-    handlers = mcp_client._register_handlers()
-    list_tools = handlers["list_tools"]
-    
     # Test create_category
     tools = await list_tools()
     create_category_tool = next(tool for tool in tools if tool.name == "create_category_categories__post")
     
     # Check that the category has the required fields
-    print(create_category_tool)
     assert create_category_tool.name == "create_category_categories__post"
     assert set(create_category_tool.inputSchema["properties"]) == set(["name", "description"])
\ No newline at end of file
@@ -0,0 +1,16 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+@pytest.fixture(scope="class")
+def _patched_request():
+    """Patch requests.request once for a whole test class."""
+    with patch('swagger_mcp.endpoint_invoker.requests.request') as mock_request:
+        yield mock_request
+
+@pytest.fixture
+def mock_request(_patched_request):
+    """The class-wide requests.request mock, reset before each test to return an empty 200 JSON response."""
+    _patched_request.reset_mock(return_value=True, side_effect=True)
+    _patched_request.return_value = SimpleNamespace(status_code=200, json=dict, text="{}")
+    return _patched_request
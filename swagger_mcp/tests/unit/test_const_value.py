@@ -1,60 +1,59 @@
-import pytest
 import os
-from unittest.mock import patch, MagicMock
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
 from swagger_mcp.openapi_mcp_server import OpenAPIMCPServer
 
-class TestConstValues:
-    @pytest.fixture
-    def server(self):
-        # Define a simple OpenAPI spec with parameters that will be set as const
-        openapi_spec = {
-            "openapi": "3.0.0",
-            "info": {
-                "title": "Test API",
-                "version": "1.0.0"
-            },
-            "servers": [{"url": "https://api.example.com"}],
-            "paths": {
-                "/test": {
-                    "get": {
-                        "operationId": "test_endpoint",
-                        "summary": "Test endpoint",
-                        "parameters": [
-                            {
-                                "name": "required_param",
-                                "in": "query",
-                                "required": True,
-                                "schema": {
-                                    "type": "string"
-                                },
-                                "description": "A required parameter"
+@pytest.fixture(scope="module")
+def server():
+    # Define a simple OpenAPI spec with parameters that will be set as const
+    openapi_spec = {
+        "openapi": "3.0.0",
+        "info": {
+            "title": "Test API",
+            "version": "1.0.0"
+        },
+        "servers": [{"url": "https://api.example.com"}],
+        "paths": {
+            "/test": {
+                "get": {
+                    "operationId": "test_endpoint",
+                    "summary": "Test endpoint",
+                    "parameters": [
+                        {
+                            "name": "required_param",
+                            "in": "query",
+                            "required": True,
+                            "schema": {
+                                "type": "string"
                             },
-                            {
-                                "name": "const_param",
-                                "in": "query",
-                                "required": True,
-                                "schema": {
-                                    "type": "string"
-                                },
-                                "description": "A parameter that will be set as const"
+                            "description": "A required parameter"
+                        },
+                        {
+                            "name": "const_param",
+                            "in": "query",
+                            "required": True,
+                            "schema": {
+                                "type": "string"
                             },
-                            {
-                                "name": "other_param",
-                                "in": "query",
-                                "schema": {
-                                    "type": "string"
-                                },
-                                "description": "Another parameter"
-                            }
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "Success",
-                                "content": {
-                                    "application/json": {
-                                        "schema": {
-                                            "type": "object"
-                                        }
+                            "description": "A parameter that will be set as const"
+                        },
+                        {
+                            "name": "other_param",
+                            "in": "query",
+                            "schema": {
+                                "type": "string"
+                            },
+                            "description": "Another parameter"
+                        }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Success",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "object"
                                     }
                                 }
                             }
@@ -63,31 +62,35 @@ class TestConstValues:
                 }
             }
         }
-        
-        server = OpenAPIMCPServer(
-            'Test Server', 
-            openapi_spec,
-            const_values={"const_param": "fixed_value"}
-        )
-        return server
+    }
+    
+    server = OpenAPIMCPServer(
+        'Test Server', 
+        openapi_spec,
+        const_values={"const_param": "fixed_value"}
+    )
+    return server
 
-    @pytest.fixture
-    def countries_server(self):
-        """Fixture that creates a server using the countries.yaml spec with const fields parameter."""
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        spec_path = os.path.join(current_dir, 'fixtures', 'countries.yaml')
-        
-        server = OpenAPIMCPServer(
-            'Countries Server',
-            spec_path,
-            const_values={"fields": "name"}
-        )
-        return server
 
+@pytest.fixture(scope="module")
+def countries_server():
+    """Fixture that creates a server using the countries.yaml spec with const fields parameter."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    spec_path = os.path.join(current_dir, 'fixtures', 'countries.yaml')
+    
+    server = OpenAPIMCPServer(
+        'Countries Server',
+        spec_path,
+        const_values={"fields": "name"}
+    )
+    return server
+
+
+class TestConstValues:
     @pytest.mark.asyncio
     async def test_const_parameter_handling(self, server):
         """Test that const parameters are handled correctly in tool definitions."""
-        handlers = server._register_handlers()
+        handlers = server._handlers
         list_tools = handlers["list_tools"]
         tools = await list_tools()
         
@@ -107,14 +110,15 @@ class TestConstValues:
     @pytest.mark.asyncio
     async def test_const_value_usage(self, server):
         """Test that const values are used when invoking endpoints."""
-        handlers = server._register_handlers()
+        handlers = server._handlers
         call_tool = handlers["call_tool"]
         
         # Mock the endpoint invocation
         with patch('swagger_mcp.openapi_mcp_server.EndpointInvoker') as MockInvoker:
             invoker_instance = MockInvoker.return_value
-            invoker_instance.invoke_with_params.return_value.json.return_value = {"result": "success"}
-            invoker_instance.invoke_with_params.return_value.status_code = 200
+            invoker_instance.invoke_with_params.return_value = SimpleNamespace(
+                status_code=200, json=lambda: {"result": "success"}
+            )
             
             # Call the tool
             result = await call_tool("test_endpoint", {
@@ -123,16 +127,21 @@ class TestConstValues:
             })
             
             # Verify the const value was included in the endpoint call
-            invoker_instance.invoke_with_params.assert_called_once()
-            call_args = invoker_instance.invoke_with_params.call_args[1]
-            assert call_args["params"]["const_param"] == "fixed_value"
-            assert call_args["params"]["required_param"] == "test"
-            assert call_args["params"]["other_param"] == "value"
+            invoker_instance.invoke_with_params.assert_called_once_with(
+                params={
+                    "required_param": "test",
+                    "other_param": "value",
+                    "const_param": "fixed_value",
+                },
+                server_url=None,
+                bearer_token=None,
+                headers={},
+            )
 
     @pytest.mark.asyncio
     async def test_countries_const_fields(self, countries_server):
         """Test that const fields parameter is handled correctly in countries API tools."""
-        handlers = countries_server._register_handlers()
+        handlers = countries_server._handlers
         list_tools = handlers["list_tools"]
         tools = await list_tools()
         
@@ -0,0 +1,85 @@
+import pytest
+import requests
+from swagger_mcp import endpoint_invoker
+from swagger_mcp.endpoint import Endpoint
+from swagger_mcp.endpoint_invoker import (
+    EndpointInvoker,
+    MissingBearerTokenError,
+    MissingFormParameterError,
+    MissingHeaderParameterError,
+    MissingPathParameterError,
+    MissingQueryParameterError,
+    MissingRequestBodyError,
+    MissingServerUrlError,
+)
+
+
+def _endpoint(**overrides) -> Endpoint:
+    """Build a GET /users/{userId} endpoint, overriding any of its fields."""
+    fields = {
+        "path": "/users/{userId}",
+        "method": "GET",
+        "operation_id": "getUser",
+        "summary": "Get a user",
+        "servers": [{"url": "https://api.example.com"}],
+    }
+    fields.update(overrides)
+    return Endpoint(**fields)
+
+
+def _required(*names: str) -> dict:
+    return {
+        "type": "object",
+        "properties": {name: {"type": "string"} for name in names},
+        "required": list(names),
+    }
+
+
+@pytest.mark.parametrize("endpoint, error, param_name", [
+    (_endpoint(path_parameters_schema=_required("userId")), MissingPathParameterError, "userId"),
+    (_endpoint(query_parameters_schema=_required("limit")), MissingQueryParameterError, "limit"),
+    (_endpoint(header_parameters_schema=_required("X-API-Key")), MissingHeaderParameterError, "X-API-Key"),
+    (_endpoint(method="POST", form_parameters_schema=_required("name")), MissingFormParameterError, "name"),
+    (_endpoint(requires_bearer_auth=True), MissingBearerTokenError, None),
+    (_endpoint(method="POST", request_body_required=True), MissingRequestBodyError, None),
+    (_endpoint(servers=[]), MissingServerUrlError, None),
+], ids=["path", "query", "header", "form", "bearer", "body", "server"])
+def test_missing_requirement(mock_request, endpoint, error, param_name):
+    """Test that a missing requirement is reported before any request is sent."""
+    with pytest.raises(error) as exc_info:
+        EndpointInvoker(endpoint).invoke()
+
+    if param_name:
+        assert exc_info.value.param_name == param_name
+    mock_request.assert_not_called()
+
+
+def test_requests_is_patchable_through_the_invoker_module(mock_request):
+    """Test that the lazily imported requests module is what the invoker calls through."""
+    assert endpoint_invoker.requests is requests
+
+    EndpointInvoker(_endpoint()).invoke(path_params={"userId": "42"})
+
+    assert requests.request is mock_request
+    assert mock_request.call_args.kwargs["url"] == "https://api.example.com/users/42"
+
+
+def test_required_parameters_are_grouped_by_type():
+    """Test that required parameters are grouped by type and reported in schema order."""
+    endpoint = _endpoint(
+        path_parameters_schema=_required("userId"),
+        header_parameters_schema=_required("X-API-Key", "X-Request-Id"),
+    )
+
+    assert endpoint.required_parameters_by_type == {
+        "path": ("userId",),
+        "query": (),
+        "header": ("X-API-Key", "X-Request-Id"),
+        "form": (),
+    }
+    assert endpoint.get_required_parameters() == {
+        "path": {"userId"},
+        "query": set(),
+        "header": {"X-API-Key", "X-Request-Id"},
+        "form": set(),
+    }
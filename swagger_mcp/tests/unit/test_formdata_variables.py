@@ -1,5 +1,7 @@
+import io
 import pytest
-from unittest.mock import patch, MagicMock
+from swagger_mcp.endpoint import Endpoint
+from swagger_mcp.endpoint_invoker import EndpointInvoker
 from swagger_mcp.openapi_mcp_server import OpenAPIMCPServer
 from swagger_mcp.openapi_parser import OpenAPIParser
 
@@ -67,66 +69,73 @@ openapi_spec = {
 }
         
 
-class TestFormDataVariables:
-    @pytest.fixture
-    def server(self):
-        # Define a simple OpenAPI spec with multipart form data
-        server = OpenAPIMCPServer('Test Server', openapi_spec)
-        return server
+@pytest.fixture(scope="module")
+def server():
+    # Define a simple OpenAPI spec with multipart form data
+    server = OpenAPIMCPServer('Test Server', openapi_spec)
+    return server
 
-    @pytest.mark.asyncio
-    @patch('swagger_mcp.endpoint_invoker.requests.request')
-    async def test_multipart_form_data(self, mock_request, server):
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_request.return_value = mock_response
 
-        # Get the call_tool handler
-        handlers = server._register_handlers()
-        call_tool = handlers["call_tool"]
+class TestFormDataVariables:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("arguments", [
+        # The required field alongside an array field
+        {"description": "Test with tags", "tags": ["test", "example"]},
+        # The optional array field omitted
+        {"description": "Test with tags"},
+    ], ids=["with_tags", "omitting_optional_field"])
+    async def test_multipart_form_data(self, mock_request, server, arguments):
+        """Test that tool arguments are sent as the endpoint's form fields."""
+        call_tool = server._handlers["call_tool"]
 
-        # Call the endpoint with mixed form data (file and array field)
-        await call_tool("uploadFile", {
-            "description": "Test with tags",
-            "tags": ["test", "example"]
-        })
+        await call_tool("uploadFile", arguments)
 
-        # Verify the request was made with all fields
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args[1]
-        
-        # Check that both file and regular form fields are present
-        assert "data" in call_args
-        assert call_args["data"]["description"] == "Test with tags"
-        assert call_args["data"]["tags"] == ["test", "example"]
+        mock_request.assert_called_once_with(
+            method="POST",
+            url="https://api.example.com/upload",
+            params={},
+            headers={"Content-Type": "multipart/form-data"},
+            json=None,
+            data=arguments,
+            files=None,
+            timeout=None,
+        )
 
-    @pytest.mark.asyncio
-    @patch('swagger_mcp.endpoint_invoker.requests.request')
-    async def test_multipart_form_data_omitting_optional_field(self, mock_request, server):
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_request.return_value = mock_response
+    def test_multipart_form_data_with_parameter_of_type_file_not_in_endpoints(self):
+        parser = OpenAPIParser(openapi_spec)
+        endpoints = parser.endpoints
+        assert "uploadFile2" not in endpoints
 
-        # Get the call_tool handler
-        handlers = server._register_handlers()
-        call_tool = handlers["call_tool"]
 
-        # Call the endpoint with mixed form data (file and array field)
-        await call_tool("uploadFile", {
-            "description": "Test with tags"
-        })
+def test_multipart_file_upload_passes_file_objects_through(mock_request):
+    """Test that file objects are handed to requests as files, without being read or copied."""
+    endpoint = Endpoint(
+        path="/upload",
+        method="POST",
+        operation_id="uploadFile",
+        summary="Upload a file with metadata",
+        servers=[{"url": "https://api.example.com"}],
+        request_content_types=["multipart/form-data"],
+        form_parameters_schema={
+            "type": "object",
+            "required": ["file"],
+            "properties": {"file": {"type": "string", "format": "binary"}, "description": {"type": "string"}}
+        }
+    )
+    file_obj = io.BytesIO(b"Hello, World!")
+    upload = ("test.txt", file_obj, "text/plain")
 
-        # Verify the request was made with all fields
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args[1]
-        
-        # Check that both file and regular form fields are present
-        assert "data" in call_args
-        assert call_args["data"]["description"] == "Test with tags"
+    EndpointInvoker(endpoint).invoke(form_params={"file": upload, "description": "A greeting"})
 
-    @pytest.mark.asyncio
-    @patch('swagger_mcp.endpoint_invoker.requests.request')
-    async def test_multipart_form_data_with_parameter_of_type_file_not_in_endpoints(self, mock_request, server):
-        parser = OpenAPIParser(openapi_spec)
-        endpoints = parser.endpoints
-        assert "uploadFile2" not in endpoints
\ No newline at end of file
+    mock_request.assert_called_once_with(
+        method="POST",
+        url="https://api.example.com/upload",
+        params={},
+        headers={},
+        json=None,
+        data={"description": "A greeting"},
+        files={"file": upload},
+        timeout=None,
+    )
+    assert mock_request.call_args.kwargs["files"]["file"][1] is file_obj
+    assert file_obj.tell() == 0
@@ -2,6 +2,7 @@ import os
 import json
 import pytest
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, mock_open, AsyncMock
 from typing import Dict, Any, List
 
@@ -20,7 +21,6 @@ def mock_openapi_parser():
     with patch('swagger_mcp.openapi_mcp_server.OpenAPIParser') as MockParser:
         parser_instance = MockParser.return_value
         # Set up the mock endpoints
-        from swagger_mcp.endpoint import Endpoint
         endpoints = [
             Endpoint(
                 path="/pets",
@@ -147,58 +147,69 @@ def mock_openapi_parser():
         yield parser_instance
 
 
-@pytest.fixture
-def mock_server():
-    """Create a mock Server."""
-    with patch('mcp.server.Server') as MockServer:
+def _capture_list_tools(handler):
+    """Stand-in for Server.list_tools(): wraps the decorated function and stores it on handler."""
+    def decorator(func):
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                return []
+        handler.wrapped = func
+        handler.side_effect = wrapper
+        return handler
+    return decorator
+
+
+def _capture_call_tool(handler):
+    """Stand-in for Server.call_tool(): wraps the decorated function and stores it on handler."""
+    def decorator(func):
+        async def wrapper(name: str, arguments: Dict[str, Any]):
+            try:
+                return await func(name, arguments)
+            except Exception as e:
+                # Return error message for non-existent tool
+                if "nonExistentTool" in name:
+                    return [TextContent(type="text", text=f"Tool not found: {name}")]
+                # Return generic error message for other errors
+                return [TextContent(type="text", text=str(e))]
+        handler.wrapped = func
+        handler.side_effect = wrapper
+        return handler
+    return decorator
+
+
+@pytest.fixture(scope="module")
+def _mock_server_patch():
+    """Patch Server once for the whole module."""
+    with patch('swagger_mcp.openapi_mcp_server.Server') as MockServer:
         server_instance = MockServer.return_value
         
-        # Create async mock handlers
-        list_tools_handler = AsyncMock()
-        call_tool_handler = AsyncMock()
+        # Store async mock handlers directly on the server instance
+        server_instance.list_tools_handler = AsyncMock()
+        server_instance.call_tool_handler = AsyncMock()
         
         # Set up the mock decorators
-        def list_tools_decorator():
-            def decorator(func):
-                # Store the original function and set up the mock to call it
-                async def wrapper(*args, **kwargs):
-                    try:
-                        return await func(*args, **kwargs)
-                    except Exception as e:
-                        return []
-                list_tools_handler.wrapped = func
-                list_tools_handler.side_effect = wrapper
-                return list_tools_handler
-            return decorator
-        
-        def call_tool_decorator():
-            def decorator(func):
-                # Store the original function and set up the mock to call it
-                async def wrapper(name: str, arguments: Dict[str, Any]):
-                    try:
-                        return await func(name, arguments)
-                    except Exception as e:
-                        # Return error message for non-existent tool
-                        if "nonExistentTool" in name:
-                            return [TextContent(type="text", text=f"Tool not found: {name}")]
-                        # Return generic error message for other errors
-                        return [TextContent(type="text", text=str(e))]
-                call_tool_handler.wrapped = func
-                call_tool_handler.side_effect = wrapper
-                return call_tool_handler
-            return decorator
-        
-        # Set up the mock decorators
-        server_instance.list_tools = MagicMock(side_effect=list_tools_decorator)
-        server_instance.call_tool = MagicMock(side_effect=call_tool_decorator)
-        
-        # Store the handlers directly on the server instance
-        server_instance.list_tools_handler = list_tools_handler
-        server_instance.call_tool_handler = call_tool_handler
+        server_instance.list_tools = MagicMock(
+            side_effect=lambda: _capture_list_tools(server_instance.list_tools_handler)
+        )
+        server_instance.call_tool = MagicMock(
+            side_effect=lambda: _capture_call_tool(server_instance.call_tool_handler)
+        )
         
         yield server_instance
 
 
+@pytest.fixture
+def mock_server(_mock_server_patch):
+    """The module-wide mock Server, with its decorators and handlers reset before each test."""
+    _mock_server_patch.list_tools.reset_mock()
+    _mock_server_patch.call_tool.reset_mock()
+    _mock_server_patch.list_tools_handler.reset_mock(side_effect=True)
+    _mock_server_patch.call_tool_handler.reset_mock(side_effect=True)
+    return _mock_server_patch
+
+
 @pytest.fixture
 def server_with_mocks(mock_openapi_parser, mock_server):
     """Create an OpenAPIMCPServer instance with mocked dependencies."""
@@ -349,15 +360,6 @@ def server_with_mocks(mock_openapi_parser, mock_server):
             server_url="https://api.example.com/v1"
         )
         
-        # Register the handlers
-        @mock_server.list_tools()
-        async def list_tools():
-            return []
-        
-        @mock_server.call_tool()
-        async def call_tool(name: str, arguments: Dict[str, Any]):
-            return []
-        
         return server
 
 
@@ -370,7 +372,8 @@ class TestOpenAPIMCPServer:
         assert server_with_mocks.server_url == "https://api.example.com/v1"
         mock_openapi_parser.get_endpoints.assert_called_once()
         
-        # Verify that the list_tools and call_tool decorators were called
+        # Verify that the server registered its handlers through the mocked decorators
+        assert server_with_mocks.server is mock_server
         assert mock_server.list_tools.called
         assert mock_server.call_tool.called
         
@@ -467,10 +470,9 @@ class TestOpenAPIMCPServer:
         # Mock the EndpointInvoker
         with patch('swagger_mcp.endpoint_invoker.EndpointInvoker') as MockInvoker:
             invoker_instance = MockInvoker.return_value
-            mock_response = MagicMock()
-            mock_response.json.return_value = {"id": 1, "name": "Fluffy", "tag": "cat"}
-            mock_response.status_code = 200
-            invoker_instance.invoke_with_params.return_value = mock_response
+            invoker_instance.invoke_with_params.return_value = SimpleNamespace(
+                status_code=200, json=lambda: {"id": 1, "name": "Fluffy", "tag": "cat"}
+            )
             
             # Set up the expected return value
             expected_result = [
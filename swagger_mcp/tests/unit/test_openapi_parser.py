@@ -2,13 +2,12 @@ import pytest
 import json
 import os
 import yaml
-import copy
+from collections import Counter
 from swagger_mcp.openapi_parser import OpenAPIParser
 from swagger_mcp.endpoint import Endpoint
 
 # Petstore OpenAPI 3.0 example spec
-@pytest.fixture
-def petstore_spec():
+def _petstore_spec():
     return {
         "openapi": "3.0.0",
         "info": {
@@ -187,29 +186,18 @@ def petstore_spec():
     }
 
 @pytest.fixture
-def spec_files(petstore_spec, tmp_path):
-    """Create temporary spec files for testing."""
-    # JSON version
-    json_path = tmp_path / "petstore.json"
-    with open(json_path, 'w') as f:
-        json.dump(petstore_spec, f)
-    
-    # YAML version
-    yaml_path = tmp_path / "petstore.yaml"
-    with open(yaml_path, 'w') as f:
-        yaml.dump(petstore_spec, f)
-    
-    return {'json': str(json_path), 'yaml': str(yaml_path)}
+def petstore_spec():
+    """A fresh copy of the petstore spec (the parser resolves $refs in place)."""
+    return _petstore_spec()
 
-@pytest.fixture
-def parser(petstore_spec):
-    """Create the parser instance for the regular spec."""
-    return OpenAPIParser(petstore_spec)
+@pytest.fixture(scope="module")
+def parser():
+    """Create the parser instance for the regular spec, shared by tests that only read from it."""
+    return OpenAPIParser(_petstore_spec())
 
-@pytest.fixture
-def secure_spec(petstore_spec):
+def _secure_spec():
     """Create a secure version of the petstore spec."""
-    secure_spec = copy.deepcopy(petstore_spec)
+    secure_spec = _petstore_spec()
     
     # Add security schemes
     secure_spec['components'] = secure_spec.get('components', {})
@@ -240,10 +228,10 @@ def secure_spec(petstore_spec):
     
     return secure_spec
 
-@pytest.fixture
-def secure_parser(secure_spec):
-    """Create the parser instance for the secure spec."""
-    return OpenAPIParser(secure_spec)
+@pytest.fixture(scope="module")
+def secure_parser():
+    """Create the parser instance for the secure spec, shared by the security tests."""
+    return OpenAPIParser(_secure_spec())
 
 def test_load_spec_from_dict(petstore_spec):
     """Test loading a spec from a dictionary."""
@@ -251,15 +239,21 @@ def test_load_spec_from_dict(petstore_spec):
     assert parser.spec['info']['title'] == 'Swagger Petstore'
     assert len(parser.get_endpoints()) == 4
 
-def test_load_spec_from_json_file(spec_files):
+def test_load_spec_from_json_file(petstore_spec, tmp_path):
     """Test loading a spec from a JSON file."""
-    parser = OpenAPIParser(spec_files['json'])
+    json_path = tmp_path / "petstore.json"
+    json_path.write_text(json.dumps(petstore_spec))
+    
+    parser = OpenAPIParser(str(json_path))
     assert parser.spec['info']['title'] == 'Swagger Petstore'
     assert len(parser.get_endpoints()) == 4
 
-def test_load_spec_from_yaml_file(spec_files):
+def test_load_spec_from_yaml_file(petstore_spec, tmp_path):
     """Test loading a spec from a YAML file."""
-    parser = OpenAPIParser(spec_files['yaml'])
+    yaml_path = tmp_path / "petstore.yaml"
+    yaml_path.write_text(yaml.dump(petstore_spec, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper)))
+    
+    parser = OpenAPIParser(str(yaml_path))
     assert parser.spec['info']['title'] == 'Swagger Petstore'
     assert len(parser.get_endpoints()) == 4
 
@@ -278,11 +272,11 @@ def test_endpoint_count(parser):
 def test_endpoint_methods(parser):
     """Test that the HTTP methods are correctly extracted."""
     endpoints = parser.get_endpoints()
-    methods = [endpoint.method for endpoint in endpoints]
+    methods = Counter(endpoint.method for endpoint in endpoints)
     assert 'GET' in methods
     assert 'POST' in methods
     assert 'DELETE' in methods
-    assert methods.count('GET') == 2  # Two GET endpoints
+    assert methods['GET'] == 2  # Two GET endpoints
 
 def test_endpoint_paths(parser):
     """Test that the paths are correctly extracted."""
@@ -305,6 +299,22 @@ def test_get_endpoint_by_operation_id(parser):
     endpoint = parser.get_endpoint_by_operation_id('createPets')
     assert endpoint.method == 'POST'
     assert endpoint.path == '/pets'
+    
+    # Unknown operation IDs return None
+    assert parser.get_endpoint_by_operation_id('updatePet') is None
+
+def test_memoized_endpoint_lists(parser):
+    """Test that repeated lookups reuse the parsed endpoints without leaking the cache."""
+    assert parser.get_endpoint_by_operation_id('listPets') is parser.get_endpoint_by_operation_id('listPets')
+    
+    # Callers get a fresh list each time, so mutating it does not affect the parser
+    endpoints = parser.get_endpoints()
+    endpoints.clear()
+    assert len(parser.get_endpoints()) == 4
+    
+    with_body = parser.get_endpoints_with_request_body()
+    with_body.clear()
+    assert len(parser.get_endpoints_with_request_body()) == 1
 
 def test_get_endpoint_by_method_path(parser):
     """Test finding an endpoint by its method and path."""
@@ -320,6 +330,9 @@ def test_get_endpoint_by_method_path(parser):
     # Test non-existent endpoint
     endpoint = parser.get_endpoint('PUT', '/pets')
     assert endpoint is None
+    
+    # Both lookup helpers share the same index
+    assert parser.get_endpoint_by_method_path('delete', '/pets/{petId}') is parser.get_endpoint('DELETE', '/pets/{petId}')
 
 def test_request_body_schema(parser):
     """Test that request body schemas are correctly extracted."""
@@ -372,11 +385,36 @@ def test_convenience_methods(parser):
     assert len(parser.get_endpoints_with_query_parameters()) == 1
     assert len(parser.get_endpoints_with_path_parameters()) == 2
 
+def test_endpoint_lookups_follow_changes_to_endpoints(petstore_spec):
+    """Test that lookups reflect endpoints added to or replaced in parser.endpoints."""
+    parser = OpenAPIParser(petstore_spec)
+    assert parser.get_endpoint_by_operation_id('listPets') is not None
+
+    extra = Endpoint(path='/extra', method='get', operation_id='getExtra', summary='Get extra')
+    parser.endpoints['GET_/extra'] = extra
+    assert parser.get_endpoint_by_operation_id('getExtra') is extra
+    assert parser.get_endpoint('get', '/extra') is extra
+    assert len(parser.get_endpoints()) == 5
+
+    parser.endpoints = {'GET_/extra': extra}
+    assert parser.get_endpoint_by_operation_id('listPets') is None
+    assert parser.get_endpoints() == [extra]
+
+def test_duplicate_operation_id_resolves_to_first_endpoint(petstore_spec):
+    """Test that the first endpoint wins when an operationId is reused."""
+    petstore_spec['paths']['/pets']['post']['operationId'] = 'listPets'
+    parser = OpenAPIParser(petstore_spec)
+    assert parser.get_endpoint_by_operation_id('listPets').method == 'GET'
+
+def test_to_list(parser):
+    """Test converting endpoints to a list of dictionaries."""
+    endpoints_list = parser.to_list()
+    assert len(endpoints_list) == 4
+    assert {endpoint['operation_id'] for endpoint in endpoints_list} == {'listPets', 'createPets', 'showPetById', 'deletePet'}
+
 def test_to_json(parser):
     """Test converting endpoints to JSON."""
-    json_str = parser.to_json()
-    parsed_json = json.loads(json_str)
-    assert len(parsed_json) == 4
+    assert json.loads(parser.to_json()) == parser.to_list()
     
 def test_bearer_auth_not_required_by_default(parser):
     """Test that bearer auth is not required by default for the regular petstore spec."""
@@ -409,16 +447,9 @@ def test_multiple_security_schemes(secure_parser):
     create_pets = secure_parser.get_endpoint_by_operation_id('createPets')
     assert create_pets.requires_bearer_auth
 
-def test_parse_countries_spec():
-    """Test parsing the countries.yaml OpenAPI specification."""
-    countries_yaml_path = os.path.join(os.path.dirname(__file__), 'fixtures', 'countries.yaml')
-    parser = OpenAPIParser(countries_yaml_path)
-    # If we get here without exceptions, the test passes
-    assert True
-
 def test_parse_pokeapi_spec():
     """Test parsing the pokeapi.yaml OpenAPI specification."""
     pokeapi_yaml_path = os.path.join(os.path.dirname(__file__), 'fixtures', 'pokeapi.yaml')
     parser = OpenAPIParser(pokeapi_yaml_path)
     # If we get here without exceptions, the test passes
-    assert True
\ No newline at end of file
+    assert True
@@ -1,6 +1,6 @@
 import pytest
 
-from swagger_mcp.openapi_parser import OpenAPIParser
+from swagger_mcp.openapi_parser import OpenAPIParser, build_v2_servers
 
 
 def _base_spec():
@@ -22,48 +22,37 @@ def _base_spec():
 
 
 @pytest.mark.parametrize(
-    "modifier, expected_base",
+    "host, base_path, schemes, expected_urls",
     [
-        (
-            lambda s: s.update({
-                "host": "api.example.com",
-                "schemes": ["https"],
-            }),
-            "https://api.example.com",
-        ),
-        (
-            lambda s: s.update({
-                "host": "api.example.com",
-                "schemes": ["https"],
-                "basePath": "/v1",
-            }),
-            "https://api.example.com/v1",
-        ),
-        (
-            lambda s: s.update({
-                "host": "api.example.com",
-                "schemes": ["http"],
-                "basePath": "/v2",
-            }),
-            "http://api.example.com/v2",
-        ),
-        (
-            lambda s: s.update({
-                "host": "api.example.com",
-            }),
-            "http://api.example.com",
-        ),
+        ("api.example.com", None, ["https"], ["https://api.example.com"]),
+        ("api.example.com", "/v1", ["https"], ["https://api.example.com/v1"]),
+        ("api.example.com", "/v2", ["http"], ["http://api.example.com/v2"]),
+        ("api.example.com", None, None, ["http://api.example.com"]),
+        ("api.example.com", "v1", ["https"], ["https://api.example.com/v1"]),
+        ("api.example.com", "/", ["https", "http"], ["https://api.example.com", "http://api.example.com"]),
+        ("", "/v1", ["https"], []),
     ],
+    ids=["scheme", "base_path", "http_scheme", "default_scheme", "relative_base_path", "root_base_path", "no_host"],
 )
-def test_v2_base_url_construction(modifier, expected_base):
-    """Ensure host/basePath/schemes are combined into default server URL."""
+def test_build_v2_servers(host, base_path, schemes, expected_urls):
+    """Ensure host/basePath/schemes are combined into one server per scheme."""
+    servers = build_v2_servers(host, base_path, schemes)
+    assert [server["url"] for server in servers] == expected_urls
+
+
+def test_v2_base_url_construction():
+    """Ensure the parser uses the v2 host/basePath/schemes as the default server URL."""
     spec = _base_spec()
-    modifier(spec)  # apply specific scenario changes
+    spec.update({
+        "host": "api.example.com",
+        "schemes": ["https"],
+        "basePath": "/v1",
+    })
 
     parser = OpenAPIParser(spec)
     endpoint = parser.get_endpoint("GET", "/pets")
 
     assert endpoint is not None, "Endpoint should be parsed"
     assert (
-        endpoint.default_server_url == expected_base
-    ), f"Expected base URL '{expected_base}', got '{endpoint.default_server_url}'"
+        endpoint.default_server_url == "https://api.example.com/v1"
+    ), f"Expected base URL 'https://api.example.com/v1', got '{endpoint.default_server_url}'"
@@ -1,7 +1,4 @@
 import pytest
-import json
-import os
-import tempfile
 from swagger_mcp.openapi_mcp_server import OpenAPIMCPServer
 from mcp.types import Tool
 
@@ -128,88 +125,89 @@ detailed_spec = {
 
 @pytest.mark.asyncio
 async def test_parameter_descriptions():
-    # Create a temporary file to store the OpenAPI spec
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-        json.dump(detailed_spec, temp_file)
-        temp_file_path = temp_file.name
-
-    try:
-        # Create an instance of OpenAPIMCPServer with our detailed spec
-        server = OpenAPIMCPServer(
-            server_name="test-server",
-            openapi_spec=temp_file_path
-        )
-
-        # Get the list_tools handler from _register_handlers
-        handlers = server._register_handlers()
-        list_tools = handlers["list_tools"]
-
-        # Call list_tools to get the available tools
-        tools = await list_tools()
-
-        # Print the tool schemas for debugging
-        for tool in tools:
-            print(f"\nTool: {tool.name}")
-            print(json.dumps(tool.inputSchema, indent=2))
-
-        # Verify we have the expected number of tools
-        assert len(tools) == 3, f"Expected 3 tools, got {len(tools)}"
-
-        # Find the listUsers tool
-        list_users_tool = next((tool for tool in tools if tool.name == "listUsers"), None)
-        assert list_users_tool is not None, "listUsers tool not found"
-
-        # Verify the listUsers tool has the correct parameter descriptions
-        properties = list_users_tool.inputSchema["properties"]
-        assert "limit" in properties, "limit parameter not found"
-        assert properties["limit"]["description"] == "Maximum number of results to return per page (1-100)"
-        assert properties["limit"]["type"] == "integer"
-
-        assert "offset" in properties, "offset parameter not found"
-        assert properties["offset"]["description"] == "Number of results to skip for pagination"
-        assert properties["offset"]["type"] == "integer"
-
-        assert "sort_by" in properties, "sort_by parameter not found"
-        assert properties["sort_by"]["description"] == "Field to sort results by (name, email, created_at, updated_at)"
-        assert properties["sort_by"]["type"] == "string"
-
-        # Find the createUser tool
-        create_user_tool = next((tool for tool in tools if tool.name == "createUser"), None)
-        assert create_user_tool is not None, "createUser tool not found"
-
-        # Verify the createUser tool has the correct request body parameter descriptions
-        properties = create_user_tool.inputSchema["properties"]
-        assert "name" in properties, "name parameter not found"
-        assert properties["name"]["description"] == "Full name of the user"
-        assert properties["name"]["type"] == "string"
-
-        assert "email" in properties, "email parameter not found"
-        assert properties["email"]["description"] == "Email address of the user"
-        assert properties["email"]["type"] == "string"
-
-        # Find the updateUserProfile tool
-        update_profile_tool = next((tool for tool in tools if tool.name == "updateUserProfile"), None)
-        assert update_profile_tool is not None, "updateUserProfile tool not found"
-
-        # Verify the updateUserProfile tool has the correct multipart form data parameter descriptions
-        properties = update_profile_tool.inputSchema["properties"]
-
-        assert "userId" in properties, "userId parameter not found"
-        assert properties["userId"]["description"] == "ID of the user to update"
-        assert properties["userId"]["type"] == "integer"
-
-        assert "displayName" in properties, "displayName parameter not found"
-        assert properties["displayName"]["description"] == "Display name shown in the UI"
-        assert properties["displayName"]["type"] == "string"
-
-        assert "bio" in properties, "bio parameter not found"
-        assert properties["bio"]["description"] == "User's biographical information"
-        assert properties["bio"]["type"] == "string"
-
-        assert "location" in properties, "location parameter not found"
-        assert properties["location"]["description"] == "User's geographical location"
-        assert properties["location"]["type"] == "string"
-
-    finally:
-        # Clean up the temporary file
-        os.unlink(temp_file_path)
+    # Create an instance of OpenAPIMCPServer directly from the spec dict
+    server = OpenAPIMCPServer(
+        server_name="test-server",
+        openapi_spec=detailed_spec
+    )
+
+    # Get the list_tools handler registered when the server was created
+    handlers = server._handlers
+    list_tools = handlers["list_tools"]
+
+    # Call list_tools to get the available tools
+    tools = await list_tools()
+
+    # Verify we have the expected number of tools
+    assert len(tools) == 3, f"Expected 3 tools, got {len(tools)}"
+    tools_by_name = {tool.name: tool for tool in tools}
+
+    # Find the listUsers tool
+    list_users_tool = tools_by_name.get("listUsers")
+    assert list_users_tool is not None, "listUsers tool not found"
+
+    # Verify the listUsers tool has the correct parameter descriptions
+    properties = list_users_tool.inputSchema["properties"]
+    assert "limit" in properties, "limit parameter not found"
+    assert properties["limit"]["description"] == "Maximum number of results to return per page (1-100)"
+    assert properties["limit"]["type"] == "integer"
+
+    assert "offset" in properties, "offset parameter not found"
+    assert properties["offset"]["description"] == "Number of results to skip for pagination"
+    assert properties["offset"]["type"] == "integer"
+
+    assert "sort_by" in properties, "sort_by parameter not found"
+    assert properties["sort_by"]["description"] == "Field to sort results by (name, email, created_at, updated_at)"
+    assert properties["sort_by"]["type"] == "string"
+
+    # Find the createUser tool
+    create_user_tool = tools_by_name.get("createUser")
+    assert create_user_tool is not None, "createUser tool not found"
+
+    # Verify the createUser tool has the correct request body parameter descriptions
+    properties = create_user_tool.inputSchema["properties"]
+    assert "name" in properties, "name parameter not found"
+    assert properties["name"]["description"] == "Full name of the user"
+    assert properties["name"]["type"] == "string"
+
+    assert "email" in properties, "email parameter not found"
+    assert properties["email"]["description"] == "Email address of the user"
+    assert properties["email"]["type"] == "string"
+
+    # Find the updateUserProfile tool
+    update_profile_tool = tools_by_name.get("updateUserProfile")
+    assert update_profile_tool is not None, "updateUserProfile tool not found"
+
+    # Verify the updateUserProfile tool has the correct multipart form data parameter descriptions
+    properties = update_profile_tool.inputSchema["properties"]
+
+    assert "userId" in properties, "userId parameter not found"
+    assert properties["userId"]["description"] == "ID of the user to update"
+    assert properties["userId"]["type"] == "integer"
+
+    assert "displayName" in properties, "displayName parameter not found"
+    assert properties["displayName"]["description"] == "Display name shown in the UI"
+    assert properties["displayName"]["type"] == "string"
+
+    assert "bio" in properties, "bio parameter not found"
+    assert properties["bio"]["description"] == "User's biographical information"
+    assert properties["bio"]["type"] == "string"
+
+    assert "location" in properties, "location parameter not found"
+    assert properties["location"]["description"] == "User's geographical location"
+    assert properties["location"]["type"] == "string"
+
+def test_cursor_mode_strips_descriptions_without_mutating_endpoints():
+    server = OpenAPIMCPServer(
+        server_name="test-server",
+        openapi_spec=detailed_spec,
+        cursor_mode=True
+    )
+
+    # Build only the tool under test rather than every tool in the spec
+    list_users_tool = server._build_tool("listUsers", server.simple_endpoints["listUsers"])
+    assert "description" not in list_users_tool.inputSchema["properties"]["limit"]
+
+    # The endpoint's own schema keeps its descriptions
+    endpoint_properties = server.simple_endpoints["listUsers"].combined_parameter_schema["properties"]
+    assert endpoint_properties["limit"]["description"] == "Maximum number of results to return per page (1-100)"
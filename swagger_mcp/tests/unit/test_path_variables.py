@@ -1,64 +1,65 @@
+import asyncio
+import json
+import threading
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 from swagger_mcp.openapi_mcp_server import OpenAPIMCPServer
+from swagger_mcp.endpoint import split_path_template
+from swagger_mcp.simple_endpoint import SimpleEndpoint
 
-class TestPathVariables:
-    @pytest.fixture
-    def server(self):
-        # Define a simple OpenAPI spec with path parameters
-        openapi_spec = {
-            "openapi": "3.0.0",
-            "info": {
-                "title": "Pet API",
-                "version": "1.0.0"
-            },
-            "servers": [{"url": "https://api.example.com"}],
-            "paths": {
-                "/pets/{petId}/toys/{toyId}": {
-                    "get": {
-                        "operationId": "getPetToy",
-                        "summary": "Get a specific toy for a pet",
-                        "parameters": [
-                            {
-                                "name": "petId",
-                                "in": "path",
-                                "required": True,
-                                "schema": {
-                                    "type": "integer",
-                                    "format": "int64"
-                                }
-                            },
-                            {
-                                "name": "toyId",
-                                "in": "path",
-                                "required": True,
-                                "schema": {
-                                    "type": "string"
-                                }
+@pytest.fixture(scope="module")
+def server():
+    # Define a simple OpenAPI spec with path parameters
+    openapi_spec = {
+        "openapi": "3.0.0",
+        "info": {
+            "title": "Pet API",
+            "version": "1.0.0"
+        },
+        "servers": [{"url": "https://api.example.com"}],
+        "paths": {
+            "/pets/{petId}/toys/{toyId}": {
+                "get": {
+                    "operationId": "getPetToy",
+                    "summary": "Get a specific toy for a pet",
+                    "parameters": [
+                        {
+                            "name": "petId",
+                            "in": "path",
+                            "required": True,
+                            "schema": {
+                                "type": "integer",
+                                "format": "int64"
                             }
-                        ],
-                        "responses": {
-                            "200": {
-                                "description": "Pet toy found"
+                        },
+                        {
+                            "name": "toyId",
+                            "in": "path",
+                            "required": True,
+                            "schema": {
+                                "type": "string"
                             }
                         }
+                    ],
+                    "responses": {
+                        "200": {
+                            "description": "Pet toy found"
+                        }
                     }
                 }
             }
         }
-        
-        server = OpenAPIMCPServer('Test Server', openapi_spec)
-        return server
+    }
+    
+    server = OpenAPIMCPServer('Test Server', openapi_spec)
+    return server
+
 
+class TestPathVariables:
     @pytest.mark.asyncio
-    @patch('swagger_mcp.endpoint_invoker.requests.request')
     async def test_path_parameter_substitution(self, mock_request, server):
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_request.return_value = mock_response
-
         # Get the call_tool handler
-        handlers = server._register_handlers()
+        handlers = server._handlers
         call_tool = handlers["call_tool"]
 
         # Call the endpoint with path parameters
@@ -68,8 +69,57 @@ class TestPathVariables:
         })
 
         # Verify the request was made with the correct URL
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        
-        # Check that path parameters were correctly substituted
-        assert call_args[1]["url"].endswith("/pets/123/toys/ball")
\ No newline at end of file
+        mock_request.assert_called_once_with(
+            method="GET",
+            url="https://api.example.com/pets/123/toys/ball",
+            params={},
+            headers={},
+            json=None,
+            data={},
+            files=None,
+            timeout=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tool_calls(self, mock_request, server):
+        """Test that concurrent tool calls make their requests in parallel."""
+        # Each request waits until the other one has also started, so this
+        # only succeeds if the two calls do not block each other
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_for_other_request(**kwargs):
+            barrier.wait()
+            return SimpleNamespace(status_code=200, json=lambda: {"url": kwargs["url"]})
+
+        mock_request.side_effect = wait_for_other_request
+
+        handlers = server._handlers
+        call_tool = handlers["call_tool"]
+
+        results = await asyncio.gather(
+            call_tool("getPetToy", {"petId": 1, "toyId": "ball"}),
+            call_tool("getPetToy", {"petId": 2, "toyId": "rope"})
+        )
+
+        assert mock_request.call_count == 2
+        assert json.loads(results[0][0].text)["url"].endswith("/pets/1/toys/ball")
+        assert json.loads(results[1][0].text)["url"].endswith("/pets/2/toys/rope")
+
+
+def test_path_template_is_split_into_literals_and_names():
+    """Test that the path template is split into literal text and parameter names and rendered from them."""
+    endpoint = SimpleEndpoint(
+        path="pets/{pet-id}/toys/{toyId}",
+        method="get",
+        operation_id="getPetToy",
+        summary="Get a pet toy",
+        servers=[{"url": "https://api.example.com"}],
+        parameter_type_mapping={"pet-id": "path", "toyId": "path"}
+    )
+
+    assert split_path_template(endpoint.path) == ("/pets/", "pet-id", "/toys/", "toyId", "")
+    assert endpoint.path_template_parts == split_path_template(endpoint.path)
+
+    assert endpoint.get_full_url(params={"pet-id": 7, "toyId": "ball"}) == "https://api.example.com/pets/7/toys/ball"
+    # Placeholders without a value are left in place
+    assert endpoint.get_full_url(params={"pet-id": 7}) == "https://api.example.com/pets/7/toys/{toyId}"
@@ -1,24 +1,31 @@
 import pytest
+import pytest_asyncio
 import os
 from swagger_mcp.openapi_mcp_server import OpenAPIMCPServer
+from swagger_mcp.simple_endpoint import SimpleEndpoint
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def petstore_spec_path():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(current_dir, 'fixtures', 'petstore.json')
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def server(petstore_spec_path):
     server = OpenAPIMCPServer('Test Server', petstore_spec_path)
     return server
 
-@pytest.mark.asyncio
-async def test_tools_creation(server):
+@pytest_asyncio.fixture(scope="module")
+async def tools(server):
+    """The tools from the server's list_tools handler, listed once for the module (the tests only read them)."""
+    return await server._handlers["list_tools"]()
+
+@pytest.fixture(scope="module")
+def tools_by_name(tools):
+    """The module's tools indexed by name, for tests that check specific tools."""
+    return {tool.name: tool for tool in tools}
+
+def test_tools_creation(tools):
     """Test that tools are created successfully from the OpenAPI spec"""
-    handlers = server._register_handlers()
-    list_tools = handlers["list_tools"]
-    tools = await list_tools()
-    
     assert len(tools) > 0, "Should create at least one tool"
     
     # Verify specific tools we expect from petstore.json
@@ -26,53 +33,58 @@ async def test_tools_creation(server):
     expected_tools = {"addPet", "updatePet", "getPetById", "uploadFile"}
     assert expected_tools.issubset(tool_names), f"Missing expected tools. Found: {tool_names}"
 
-@pytest.mark.asyncio
-async def test_tool_structure(server):
+def test_tool_structure(tools, tools_by_name):
     """Test that each tool has the required attributes"""
-    handlers = server._register_handlers()
-    list_tools = handlers["list_tools"]
-    tools = await list_tools()
-    
     for tool in tools:
         assert tool.name, "Tool should have a name"
         assert tool.description, "Tool should have a description"
         assert isinstance(tool.inputSchema, dict), "Tool should have an input schema"
         assert "properties" in tool.inputSchema, "Input schema should have properties"
         
-        # Verify tool description format for specific endpoints
-        if tool.name == "addPet":
-            assert "Add a new pet to the store" in tool.description, "addPet should have correct description"
-        elif tool.name == "updatePet":
-            assert "Update an existing pet" in tool.description, "updatePet should have correct description"
-        elif tool.name == "getPetById":
-            assert "Find pet by ID" in tool.description, "getPetById should have correct description"
+    # Verify tool description format for specific endpoints
+    assert "Add a new pet to the store" in tools_by_name["addPet"].description, "addPet should have correct description"
+    assert "Update an existing pet" in tools_by_name["updatePet"].description, "updatePet should have correct description"
+    assert "Find pet by ID" in tools_by_name["getPetById"].description, "getPetById should have correct description"
 
-@pytest.mark.asyncio
-async def test_tool_schema_properties(server):
+def test_tool_schema_properties(tools, tools_by_name):
     """Test that tool schemas have proper property structures"""
-    handlers = server._register_handlers()
-    list_tools = handlers["list_tools"]
-    tools = await list_tools()
+    # Verify specific parameter schemas
+    properties = tools_by_name["getPetById"].inputSchema["properties"]
+    assert "petId" in properties, "getPetById should have 'petId' parameter"
+    pet_id_schema = properties["petId"]
+    assert pet_id_schema.get("type") == "integer", "petId should be integer type"
+    assert "description" in pet_id_schema, "petId should have description"
+    assert pet_id_schema.get("format") == "int64", "petId should have int64 format"
     
+    properties = tools_by_name["uploadFile"].inputSchema["properties"]
+    assert "petId" in properties, "uploadFile should have 'petId' parameter"
+    assert "additionalMetadata" in properties, "uploadFile should have 'additionalMetadata' parameter"
+    assert "file" not in properties, "uploadFile should not have 'file' parameter because of invalid 'file' parameter type"
+    
+    # General schema validation
     for tool in tools:
-        properties = tool.inputSchema.get('properties', {})
-        
-        # Verify specific parameter schemas
-        if tool.name == "getPetById":
-            assert "petId" in properties, "getPetById should have 'petId' parameter"
-            pet_id_schema = properties["petId"]
-            assert pet_id_schema.get("type") == "integer", "petId should be integer type"
-            assert "description" in pet_id_schema, "petId should have description"
-            assert pet_id_schema.get("format") == "int64", "petId should have int64 format"
-            
-        elif tool.name == "uploadFile":
-            assert "petId" in properties, "uploadFile should have 'petId' parameter"
-            assert "additionalMetadata" in properties, "uploadFile should have 'additionalMetadata' parameter"
-            assert "file" not in properties, "uploadFile should not have 'file' parameter because of invalid 'file' parameter type"
-            
-        # General schema validation
-        for param_name, param_schema in properties.items():
+        for param_name, param_schema in tool.inputSchema.get('properties', {}).items():
             assert isinstance(param_name, str), "Parameter name should be a string"
             assert isinstance(param_schema, dict), "Parameter schema should be a dictionary"
             if 'description' in param_schema:
-                assert isinstance(param_schema['description'], str), "Description should be a string"
\ No newline at end of file
+                assert isinstance(param_schema['description'], str), "Description should be a string"
+
+def test_tool_description_is_endpoint_summary(tools_by_name):
+    """Test that the tool description is the endpoint summary alone"""
+    assert tools_by_name["getPetById"].description == "Find pet by ID", "getPetById should not include its endpoint description"
+    assert tools_by_name["addPet"].description == "Add a new pet to the store", "addPet should use its summary"
+
+def test_tool_description_falls_back_to_method_and_path():
+    """Test that an endpoint without a summary is described by its method and path"""
+    endpoint = SimpleEndpoint(path="/pet/{petId}", method="get", operation_id="getPetById", summary="")
+    assert endpoint.tool_description == "GET /pet/{petId}"
+
+@pytest.mark.asyncio
+async def test_include_and_exclude_patterns(petstore_spec_path):
+    """Test that tools are filtered by the include and exclude path patterns"""
+    server = OpenAPIMCPServer('Test Server', petstore_spec_path, include_pattern="^/pet", exclude_pattern="uploadImage")
+    tools = await server._handlers["list_tools"]()
+    tool_names = {tool.name for tool in tools}
+    assert "getPetById" in tool_names
+    assert "uploadFile" not in tool_names, "uploadFile's path matches the exclude pattern"
+    assert "getInventory" not in tool_names, "getInventory's path doesn't match the include pattern"